@@ -1,13 +1,25 @@
 import math
 import random
-from typing import Literal
+from typing import Literal, TYPE_CHECKING
 
 from .message import *
-from .coord import MOVE_TO_DIRECTION
+from .coord import Coord, MOVE_TO_DIRECTION, get_ray_offsets
 from .Player import Player, HumanPlayer
 
+if TYPE_CHECKING:
+    from maps.base import Map
+
+_DIRECTIONS: tuple[Literal['up', 'down', 'left', 'right'], ...] = ('up', 'down', 'left', 'right')
+_getrandbits = random.getrandbits
+
 class NPC(Player):
     """ Represents a non-player character in the game."""
+
+    __slots__ = ('_staring_distance', '__encounter_text', '__bg_music', '_stare_targets', '_facing_vec', '_stare_offsets', '_talked_set', '_volume_lut', '_dialogue_template')
+
+    # make the volume louder as the distance is smaller, exponential decay
+    SOUND_DECAY_RATE: float = 0.15  # adjust this rate to fit your needs
+
     def __init__(self, name: str, image: str, encounter_text : str, facing_direction: Literal['up', 'down', 'left', 'right'] = 'down', staring_distance: int = 0, bg_music='', passable: bool = False) -> None:
         """ Initialize the NPC with the given name, image, and facing direction.
             encounter_text: text that will be displayed when the player interacts with the NPC.
@@ -16,12 +28,52 @@ class NPC(Player):
         self._staring_distance: int = staring_distance
         self.__encounter_text: str = encounter_text
         self.__bg_music: str = bg_music
+        self._stare_targets: frozenset[tuple[int, int]] | None = None
         super().__init__(
             name=name,
             image=image,
             facing_direction=facing_direction,
             passable=passable,
         )
+        self._facing_vec: Coord = MOVE_TO_DIRECTION[facing_direction]
+        self._dialogue_template: tuple[str, str] = (encounter_text, self.get_image_name())
+        self._stare_offsets: tuple[tuple[int, int], ...] = self.__get_stare_offsets()
+        self._talked_set: set[str] = set(self.get_state('talked_to_players', []))
+        # volumes for every Manhattan distance inside the staring bounding box
+        self._volume_lut: tuple[float, ...] = tuple(math.exp(-self.SOUND_DECAY_RATE * k) for k in range(2 * staring_distance + 1)) if bg_music != '' else ()
+
+    def __get_stare_offsets(self) -> tuple[tuple[int, int], ...]:
+        """ Returns the (y, x) offsets of the cells the NPC is staring at, nearest first. """
+        return get_ray_offsets(self.get_facing_direction(), self._staring_distance)
+
+    def get_stare_targets(self) -> frozenset[tuple[int, int]]:
+        """ Returns the (y, x) positions of the cells the NPC is staring at.
+            Recomputed only after the NPC moves or turns.
+        """
+        if self._stare_targets is None:
+            y, x = self._current_position.to_tuple()
+            self._stare_targets = frozenset((y + dy, x + dx) for dy, dx in self._stare_offsets)
+        return self._stare_targets
+
+    def set_facing_direction(self, direction: Literal['up', 'down', 'left', 'right']) -> None:
+        """ Set the NPC's facing direction, updating the cells it is staring at. """
+        changed = direction != self.get_facing_direction()
+        super().set_facing_direction(direction)
+        if changed:
+            self._facing_vec = MOVE_TO_DIRECTION[direction]
+            self._dialogue_template = (self.__encounter_text, self.get_image_name())
+            self._stare_offsets = self.__get_stare_offsets()
+            self._stare_targets = None
+
+    def set_image_name(self, image_name: str) -> None:
+        """ Set the NPC's image, updating the image shown with its dialogue. """
+        super().set_image_name(image_name)
+        self._dialogue_template = (self.__encounter_text, self.get_image_name())
+
+    def update_position(self, new_position: Coord, map: "Map") -> None:
+        """ Update the NPC's position and current room, invalidating the cells it is staring at. """
+        super().update_position(new_position, map)
+        self._stare_targets = None
 
     #def fire_event(self, clock):
     #    pass
@@ -35,28 +87,30 @@ class NPC(Player):
             and then send their encounter text to the player.
         """
 
-        if type(player) != HumanPlayer:
+        if player.__class__ is not HumanPlayer:
             return []
 
         if self._staring_distance == 0: # don't interact with player if staring distance is 0
             return []
+
+        # cheap bounding-box check on the staring range before doing any other work
+        player_position = player.get_current_position()
+        dy = player_position.y - self._current_position.y
+        dx = player_position.x - self._current_position.x
+        in_range = max(abs(dy), abs(dx)) <= self._staring_distance
+        if not in_range and self.__bg_music == '':
+            return []
         
         messages: list[Message] = []
 
         # sound message
         if self.__bg_music != '':
-            dist = self._current_position.distance(player.get_current_position())
-            # make the volume louder as the distance is smaller, exponential decay
-            decay_rate = 0.15  # adjust this rate to fit your needs
-            volume = math.exp(-decay_rate * dist)
+            dist = abs(dy) + abs(dx)
+            volume = self._volume_lut[dist] if dist < len(self._volume_lut) else math.exp(-self.SOUND_DECAY_RATE * dist)
             messages.append(SoundMessage(player, self.__bg_music, volume=volume))
 
         # check if player is in range
-        direction = MOVE_TO_DIRECTION[self.get_facing_direction()]
-        for k in range(1, self._staring_distance + 1):
-            if player.get_current_position() == self._current_position + direction * k:
-                break
-        else:
+        if not in_range or player_position.to_tuple() not in self.get_stare_targets():
             return messages
 
         if self.done_talking(player):
@@ -67,37 +121,39 @@ class NPC(Player):
         # emote first.
         messages.append(EmoteMessage(self, player, 'exclamation', emote_pos=self._current_position))
 
-        # then movement towards player until it is one square away.
-        dist = self._current_position.distance(player.get_current_position())
-        while dist > (1 + self.num_rows):
-            # move towards player
-            result = self.move(self.get_facing_direction())
-            new_dist = self._current_position.distance(player.get_current_position())
-            assert new_dist < dist, f"Distance did not decrease: {dist} -> {new_dist} and position: {self._current_position}; messages: {result}"
-            dist = new_dist
-            messages += result
+        # then movement towards player until it is one square away, as a single batched move.
+        dist = abs(dy) + abs(dx)
+        steps = dist - (1 + self.num_rows)
+        if steps > 0:
+            # the player is on the stare ray, so the destination is known without re-measuring
+            destination = self._current_position + self._facing_vec * steps
+            result = self.move_n(self.get_facing_direction(), steps)
+            if __debug__ and self._current_position != destination:
+                raise RuntimeError(f"{self.get_name()} could not walk {steps} steps towards {destination}; position: {self._current_position}")
+            messages.extend(result)
 
         interact_messages: list[Message] = self.player_interacted(player)
         messages.extend(interact_messages)
 
-        # mark that we have talked to the player
-        talked_to_players = self.get_state('talked_to_players', [])
-        talked_to_players.append(player.get_email())
-        self.set_state('talked_to_players', talked_to_players)
+        # mark that we have talked to the player; written to the database on the room's next update
+        self._talked_set.add(player.get_email())
+        self.defer_state('talked_to_players', sorted(self._talked_set))
 
-        return messages
+        # send the whole reaction to the player as a single frame
+        return CompositeMessage.bundle(player, messages)
 
     def done_talking(self, player) -> bool:
-        talked_to_players = self.get_state('talked_to_players', [])
-        return player.get_email() in talked_to_players
+        return player.get_email() in self._talked_set
         
     def player_interacted(self, player: HumanPlayer) -> list[Message]:
         """ Handle the event of the player interacting with the NPC. In the default case,
             the NPC will send their encounter text to the player.
         """
-        return [DialogueMessage(self, player, self.__encounter_text, self.get_image_name())]
+        return [DialogueMessage(self, player, *self._dialogue_template)]
 
 class Professor(NPC):
+    __slots__ = ()
+
     def __init__(self, encounter_text: str, staring_distance: int = 0, facing_direction: Literal['up', 'down', 'left', 'right'] ='down') -> None:
         super().__init__(
             name="Professor",
@@ -108,6 +164,8 @@ class Professor(NPC):
         )
 
 class WalkingProfessor(Professor):
+    __slots__ = ()
+
     def __init__(self, encounter_text: str, staring_distance: int = 0, facing_direction: Literal['up', 'down', 'left', 'right'] ='down') -> None:
         super().__init__(
             encounter_text=encounter_text,
@@ -117,7 +175,6 @@ class WalkingProfessor(Professor):
     
     def update(self) -> list["Message"]:
         """ Move in a random direction. """
-        direction: Literal["up", "down", "left", "right"] = random.choice(['up', 'down', 'left', 'right'])
-        print(f"Moving {direction}")
+        direction: Literal["up", "down", "left", "right"] = _DIRECTIONS[_getrandbits(2)]
         return self.move(direction)
     
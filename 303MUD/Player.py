@@ -13,12 +13,15 @@ class Player(CharacterMapObject, SenderInterface, DatabaseEntity):
     """Player class that represents a player in the game. Contains information about the player's name,
        current position, and current room. Also contains methods to move the player and change rooms
     """
+
+    __slots__ = ('_name', '_current_position', '_current_room')
     
     def __init__(self, name: str, image: str = 'player1', facing_direction: Literal['up', 'down', 'left', 'right'] = 'down', passable: bool = True) -> None:
         super().__init__(image, passable=passable, facing_direction=facing_direction)
 
         self._name: str = name # handle
         self._current_position = Coord(0, 0)
+        self._current_room: "Map | None" = None # set once the player joins a room; player actions are only sent after that
 
     def update_position(self, new_position: Coord, map: "Map") -> None:
         """ Update the player's position and current room. """
@@ -31,7 +34,7 @@ class Player(CharacterMapObject, SenderInterface, DatabaseEntity):
 
     def get_current_position(self) -> Coord:
         """ Get the player's current position. """
-        return Coord.from_Coord(self._current_position)
+        return self._current_position
 
     def get_current_room(self) -> 'Map':
         """ Get the player's current room. """
@@ -44,8 +47,6 @@ class Player(CharacterMapObject, SenderInterface, DatabaseEntity):
     def move(self, direction_s: Literal['up', 'down', 'left', 'right']) -> list[Message]:
         """ Move the player in the given direction. """
 
-        assert self._current_room is not None
-
         update_facing_direction = self.get_facing_direction() != direction_s
         self.set_facing_direction(direction_s)
         messages = self._current_room.move(self, direction_s)
@@ -53,26 +54,37 @@ class Player(CharacterMapObject, SenderInterface, DatabaseEntity):
             messages = self._current_room.send_grid_to_players()
         return messages
 
+    def move_n(self, direction_s: Literal['up', 'down', 'left', 'right'], steps: int) -> list[Message]:
+        """ Move the player the given number of steps in the given direction as a single move. """
+
+        update_facing_direction = self.get_facing_direction() != direction_s
+        self.set_facing_direction(direction_s)
+        messages = self._current_room.move_n(self, direction_s, steps)
+        if len(messages) == 0 and update_facing_direction:
+            messages = self._current_room.send_grid_to_players()
+        return messages
+
     def move_to(self, position: Coord) -> list[Message]:
         """Move the player to the given coordinate."""
 
-        assert self._current_room is not None
-
         messages = self._current_room.move_to(self, position)
         if len(messages) == 0:
             messages = self._current_room.send_grid_to_players()
         return messages
 
-    def __str__(self) -> str:
-        """ Return a string representation of the player. """
-        return f'Player Handle: {self._name}; Map: {self._current_room.get_name() if self._current_room is not None else "None"}; Position: {self._current_position}; Image: {self.get_image_name()}'
+    def __repr__(self) -> str:
+        """ Return a string representation of the player. Also used by str(), so the text is only
+            assembled when the player is actually printed.
+        """
+        room_name = self._current_room.get_name() if self._current_room is not None else "None"
+        return f'Player Handle: {self._name}; Map: {room_name}; Position: {self._current_position}; Image: {self.get_image_name()}'
 
     def change_room(self, new_room: 'Map', msg_to_cur_room: str = "", msg_to_new_room: str = "", entry_point = None) -> list[Message]:
         """ Change the player's current room to the given room at the given coordinate (if provided).
             Sends a message to the current room and the new room to inform them of the player's departure/arrival.
         """
         
-        cur_room = self._current_room if hasattr(self, "_current_room") else None
+        cur_room = self._current_room
         if cur_room is not None:
             cur_room.remove_player(self)
         
@@ -102,6 +114,8 @@ class HumanPlayer(Player, RecipientInterface):
         websocket state, and message sequence number.
     """
 
+    __slots__ = ('__email', '__websocket_state', '__current_menu')
+
     def __init__(self, name: str, websocket_state: Any = None, email: str = "", image:str = 'player1', facing_direction: Literal['up', 'down', 'left', 'right'] = 'down', passable:bool = True) -> None:
         """ Initialize the human player. """
         self.__email: str = email
@@ -144,7 +158,8 @@ class HumanPlayer(Player, RecipientInterface):
             first_messages.append(ServerMessage(self, msg_to_player)) # tell the player they left
         first_messages.append(GridMessage(self)) # update their grid
 
-        return first_messages + messages
+        first_messages.extend(messages)
+        return first_messages
     
     def set_current_menu(self, menu_obj: 'SelectionInterface'):
         self.__current_menu = menu_obj
@@ -156,6 +171,4 @@ class HumanPlayer(Player, RecipientInterface):
 
     def interact(self) -> list[Message]:
         """ Interact with the object in front of the player. """
-        assert self._current_room is not None
-
         return self._current_room.interact(self, facing_direction=self.get_facing_direction())
@@ -9,11 +9,14 @@ import time
 import signal
 import traceback
 import threading
+import heapq
 from abc import ABC
 from enum import Enum
 from pathlib import Path
-from collections import defaultdict
-from queue import Queue, PriorityQueue
+from collections import defaultdict, deque, OrderedDict
+from operator import itemgetter
+from queue import Queue, Empty
+from functools import lru_cache
 from typing import Any, Literal, NoReturn, Union, cast, Callable
 
 try:
@@ -30,6 +33,11 @@ try:
 except:
     raise Exception("You must pip3 install requests websocket-client pygame Pillow")
 
+try:
+    from orjson import loads as json_loads # optional, faster JSON decoding
+except ImportError:
+    json_loads = json.loads
+
 from .FestSoundCombiner import render as fsc_render
 from .util import shorten_lines
 from .resources import get_resource_path
@@ -40,6 +48,24 @@ NUM_ROWS, NUM_COLS = 15, 15
 GRID_HEIGHT = 15 * TILE_SIZE
 GRID_WIDTH = 15 * TILE_SIZE
 
+MAX_MESSAGE_HISTORY = 2000 # lines kept in the chat listbox
+RECEIVE_BATCH_SIZE = 32 # server messages taken off the outbox at once
+
+# virtual events the network thread posts to the Tk thread after queueing work for it
+GRID_UPDATE_EVENT = '<<GridUpdate>>'
+WINDOW_REQUEST_EVENT = '<<WindowRequest>>'
+
+# canvas tags for the grid window
+TILE_TAG = 'tile'
+EMOTE_TAG = 'emote'
+EMOTE_DURATION = 2.0 # seconds an emote stays above a tile
+
+@lru_cache(maxsize=256)
+def rgb_to_hex(color: tuple) -> str:
+    """ Format an (r, g, b) tuple as a Tk color string. """
+    r, g, b = color
+    return "#%02x%02x%02x" % (r, g, b)
+
 class ResourceType(Enum):
     IMAGE = 'image'
     FONT = 'font'
@@ -47,19 +73,27 @@ class ResourceType(Enum):
 
     @property
     def extension(self) -> str:
-        extensions: dict[ResourceType, str] = {
-            ResourceType.IMAGE: 'png',
-            ResourceType.FONT: 'ttf',
-            ResourceType.SOUND: 'mp3',
-        }
-        return extensions[self]
+        return _EXTENSIONS[self]
+
+_EXTENSIONS: dict[ResourceType, str] = {
+    ResourceType.IMAGE: 'png',
+    ResourceType.FONT: 'ttf',
+    ResourceType.SOUND: 'mp3',
+}
 
 class ResourceManager:
     """ A class to manage resources such as images, fonts, and sounds. """
-    _cache: dict = {}
+    _cache: dict[ResourceType, OrderedDict[str, Any]] = {}
+    IMAGE_CACHE_LIMIT = 1024
+    # free PhotoImages, least recently returned first: Tk image name -> ((size, mode), PhotoImage)
+    _photoimage_pool: OrderedDict[str, tuple[tuple[tuple[int, int], str], ImageTk.PhotoImage]] = OrderedDict()
+    _photoimage_in_use: dict[str, tuple[tuple[int, int], str]] = {}
+    PHOTOIMAGE_POOL_LIMIT = 16
 
     def __init__(self):
-        self.__load_cache()
+        # Resources are loaded lazily: the first access to each asset pays a one-shot decode cost.
+        for rsrc_type in ResourceType:
+            (Path('rsrc_cache') / rsrc_type.value).mkdir(parents=True, exist_ok=True)
 
     def __load_resource(self, resource_type: ResourceType, file_path: Path) -> Union[ImageTk.PhotoImage, ImageFont.FreeTypeFont, Path]:
         """ Load a resource from disk and return a usable object. """
@@ -73,29 +107,6 @@ class ResourceManager:
         elif resource_type == ResourceType.SOUND:
             return file_path
 
-    def __load_cache(self) -> None:
-        """ Load all resources from the resources folder into the cache. """
-        for rsrc_type in ResourceType:
-            ResourceManager._cache[rsrc_type] = {}
-
-            folder_path = Path(f'rsrc_cache/{rsrc_type.name.lower()}')
-            if not os.path.exists(folder_path):
-                os.makedirs(folder_path)
-                return
-            
-            resource_dir = Path("rsrc_cache") / rsrc_type.value
-            print(resource_dir)
-            for file_path in resource_dir.rglob("*"):
-                if file_path.is_dir():
-                    continue
-                relative_path = file_path.relative_to(resource_dir).with_suffix("")
-                #print("Loading from cache", relative_path)
-                if file_path.stem.startswith('.'):
-                    continue
-                rsrc = self.__load_resource(rsrc_type, file_path)
-                ResourceManager._cache[rsrc_type][str(relative_path)] = rsrc
-                ResourceManager._cache[rsrc_type][str(file_path.relative_to(resource_dir))] = rsrc
-
     def _get_resource_from_source(self, resource_type: ResourceType, name: str) -> bytes:
         fname = name
         if '.' not in fname:
@@ -106,32 +117,57 @@ class ResourceManager:
     def __get_resource(self, resource_type: ResourceType, name: str) -> Any:
         """ Get a resource from the cache or load it from disk if it doesn't exist. """
 
-        if resource_type in ResourceManager._cache and name in ResourceManager._cache[resource_type]:
-            return ResourceManager._cache[resource_type][name]
-        
-        # get image from folder
-        data = self._get_resource_from_source(resource_type, name)
+        cache = ResourceManager._cache.setdefault(resource_type, OrderedDict())
+        if name in cache:
+            cache.move_to_end(name)
+            return cache[name]
 
-        # save to disk
         fname = name
         if '.' not in fname:
             fname += '.' + resource_type.extension
 
         file_path = Path(f'rsrc_cache/{resource_type.name.lower()}/{fname}')
-        print("Saving to cache", file_path)
-        dirname = os.path.dirname(file_path)
-        if not os.path.exists(dirname):
-            os.makedirs(dirname)
-        with open(file_path, 'wb') as f:
-            f.write(data)
+        if not file_path.exists():
+            # get image from folder
+            data = self._get_resource_from_source(resource_type, name)
+
+            # save to disk
+            print("Saving to cache", file_path)
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(file_path, 'wb') as f:
+                f.write(data)
 
         # load into cache
-        if resource_type not in ResourceManager._cache:
-            ResourceManager._cache[resource_type] = {}
-        ResourceManager._cache[resource_type][name] = self.__load_resource(resource_type, file_path)
+        rsrc = self.__load_resource(resource_type, file_path)
+        cache[name] = rsrc
+        self.__evict_if_over(resource_type)
 
         print("New resource name:", name)
-        return ResourceManager._cache[resource_type][name]
+        return rsrc
+
+    def __evict_if_over(self, resource_type: ResourceType) -> None:
+        """ Release the least recently used images once the cache grows past IMAGE_CACHE_LIMIT.
+            Images still shown by a widget are kept, since Tk blanks them once their PhotoImage is freed.
+            Fonts and sounds are small and are never evicted.
+        """
+        cache = ResourceManager._cache.get(resource_type)
+        if resource_type != ResourceType.IMAGE or cache is None:
+            return
+        for name in list(cache):
+            if len(cache) <= ResourceManager.IMAGE_CACHE_LIMIT:
+                break
+            image = cache[name]
+            if image.tk.call('image', 'inuse', str(image)):
+                cache.move_to_end(name)
+            else:
+                del cache[name]
+
+    def drop(self, name: str) -> None:
+        """ Remove an image from the cache, e.g. when the window that used it is closed. """
+        cache = ResourceManager._cache.get(ResourceType.IMAGE, {})
+        cache.pop(name, None)
+        if '.' not in name:
+            cache.pop(name + '.' + ResourceType.IMAGE.extension, None)
 
     def get_image(self, name: str) -> ImageTk.PhotoImage:
         """ Get an image resource by name. """
@@ -166,6 +202,34 @@ class ResourceManager:
         """ Get a font resource by name. """
         return self.__get_resource(ResourceType.FONT, name)
 
+    def borrow_photoimage(self, image: Image.Image) -> ImageTk.PhotoImage:
+        """ Get a PhotoImage showing image, reusing a returned one of the same size and mode when possible.
+            Meant for throwaway renders (e.g. text) that are replaced often; give it back with return_photoimage.
+        """
+        key = (image.size, image.mode)
+        pool = ResourceManager._photoimage_pool
+        # the pool is small, so a scan for the most recently returned match is cheap
+        name = next((name for name, (free_key, _) in reversed(pool.items()) if free_key == key), None)
+        if name is not None:
+            _, photo = pool.pop(name)
+            photo.paste(image)
+        else:
+            photo = ImageTk.PhotoImage(image)
+        ResourceManager._photoimage_in_use[str(photo)] = key
+        return photo
+
+    def return_photoimage(self, photo: ImageTk.PhotoImage) -> None:
+        """ Give back a PhotoImage from borrow_photoimage once nothing displays it anymore.
+            At most PHOTOIMAGE_POOL_LIMIT free images are kept, whatever their sizes; the oldest are released first.
+        """
+        key = ResourceManager._photoimage_in_use.pop(str(photo), None)
+        if key is None:
+            return
+        pool = ResourceManager._photoimage_pool
+        pool[str(photo)] = (key, photo)
+        while len(pool) > ResourceManager.PHOTOIMAGE_POOL_LIMIT:
+            pool.popitem(last=False)
+
     def render_font(self, font: ImageFont.FreeTypeFont, text: str, type_ : str = "normal", bg_color: tuple = (255, 255, 255), text_color: tuple = (0, 0, 0)) -> Image.Image:
         """
         Render multi-line text into an image with a transparent background.
@@ -176,8 +240,14 @@ class ResourceManager:
         - type_: Type of rendering, "normal" or "bold".
 
         Returns:
-        - A PIL Image object with the rendered text.
+        - A PIL Image object with the rendered text. Renders are memoized, so treat it as read-only (copy before editing).
         """
+        return ResourceManager.__render_font_cached(font, text, type_, tuple(bg_color), tuple(text_color))
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def __render_font_cached(font: ImageFont.FreeTypeFont, text: str, type_: str, bg_color: tuple, text_color: tuple) -> Image.Image:
+        """ Render text for render_font. Keyed on the font object itself, so a cached font is never confused with another. """
         
         # Split text into lines
         lines = text.split('\n') if text else ['']
@@ -187,14 +257,8 @@ class ResourceManager:
         # Define line spacing (adjust as needed)
         line_spacing = 4  # pixels
 
-        # Calculate width and height
-        max_width = 0
-        for line in lines:
-            # Use getbbox for accurate measurement
-            bbox = font.getbbox(line)
-            line_width = bbox[2] - bbox[0]
-            if line_width > max_width:
-                max_width = line_width
+        # Calculate width (the advance of the widest line) and height
+        max_width = max(int(font.getlength(line)) for line in lines)
 
         # Calculate line height based on font metrics
         line_height = ascent + descent + line_spacing
@@ -252,6 +316,15 @@ class AudioPlayer:
 
 class NetworkManager:
     """ A class to manage network communication. """
+    # Windows opened by server messages. These defaults live on the class so subclasses that skip __init__ still have them.
+    _pokemon_battle_window: "PokemonBattleWindow | None" = None
+    _options_window: "OptionsWindow | None" = None
+    _combat_ui_window: "CombatUIWindow | None" = None
+    _timer_window: "TimerWindow | None" = None
+    _combat_result_window: "CombatResultWindow | None" = None
+    _weight_window: "WeightliftingMinigameWindow | None" = None
+    # created on the first download and then reused, so keep-alive connections are shared across downloads
+    __http: "requests.Session | None" = None
 
     def __init__(self, root_window: tk.Tk, server_inbox: Queue, server_outbox: Queue, resource_manager: ResourceManager) -> None:
         self._root_window: tk.Tk = root_window
@@ -264,17 +337,19 @@ class NetworkManager:
         # curl the file
         url = f"https://infinite-fortress-70189.herokuapp.com/{path}"
         print(url)
-        response = requests.get(url)
-        # check response code
-        if response.status_code != 200:
-            raise Exception(f"Could not load {path} from server. Status code: {response.status_code}")
-        data = response.content
-        
-        # get stem of path
-        stem = os.path.basename(path)
-        # save to disk
-        with open(stem, 'wb') as f:
-            f.write(data)
+        if NetworkManager.__http is None:
+            NetworkManager.__http = requests.Session()
+        with NetworkManager.__http.get(url, stream=True) as response:
+            # check response code
+            if response.status_code != 200:
+                raise Exception(f"Could not load {path} from server. Status code: {response.status_code}")
+
+            # get stem of path
+            stem = os.path.basename(path)
+            # stream to disk without buffering the whole file in memory
+            with open(stem, 'wb') as f:
+                for chunk in response.iter_content(chunk_size=64 * 1024):
+                    f.write(chunk)
         print(f"Downloaded {path} to {stem}")
 
     def update_data(self, data_dict: dict) -> None:
@@ -289,8 +364,13 @@ class NetworkManager:
         lines = message.split('\n')
 
         short_lines = shorten_lines(lines, 75)
-        for line in short_lines:
-            messages.insert(tk.END, line)
+        if short_lines:
+            messages.insert(tk.END, *short_lines)
+
+        # keep only the most recent lines so the listbox does not grow for the whole session
+        size = messages.size()
+        if size > MAX_MESSAGE_HISTORY:
+            messages.delete(0, size - MAX_MESSAGE_HISTORY - 1)
 
         messages.yview(tk.END)
 
@@ -298,7 +378,7 @@ class NetworkManager:
         """ Handle a message from the server. """
 
         try:
-            data = json.loads(message)
+            data = json_loads(message)
         except:
             print(f"Bad message (encoding): {message}")
             return
@@ -307,316 +387,318 @@ class NetworkManager:
             print(f"Bad message (no class name): {message}")
             return
 
+        self.__dispatch_message(data)
+
+    def __dispatch_message(self, data: dict) -> None:
+        """ Handle a decoded message from the server. """
+
         print("Received message of type", data['classname'])
 
-        if data['classname'] == 'GridMessage':
-            self._grid_updates.put((data['seq_num'], 'grid', (data['grid'], data['room_name'], data['position'], data['bg_music'])))
-            if 'description' in data:
-                self.insert_message(self._messages, data['room_name'])
-                self.insert_message(self._messages, data['description'])
-        elif data['classname'] == 'EmoteMessage':
-            self._grid_updates.put((data['seq_num'], 'emote', (data['emote'], data['emote_pos'])))
-        elif data['classname'] in ['DialogueMessage', 'SoundMessage', 'MenuMessage']:
-            self._aux_queue.put(data)
-        elif data['classname'] in ['ChatMessage', 'ServerMessage']:
-            if data.get('text', '') == 'disconnect':
-                self._root_window.destroy()
-            elif 'room_name' in data:
-                self.insert_message(self._messages, f"[{data['room_name']}] {data['handle']}: {data['text']}")
+        handler = NetworkManager.__HANDLERS.get(data['classname'])
+        if handler is not None:
+            handler(self, data)
+        else:
+            print(f"Bad message (unknown class name): {data}")
+
+    def __close_window(self, attr: str) -> None:
+        """ Destroy the window stored in the given attribute (if any) and clear the attribute. """
+        window = getattr(self, attr)
+        if window is not None:
+            self._root_window.after(0, window._window.destroy)
+            setattr(self, attr, None)
+
+    def __handle_composite(self, data: dict) -> None:
+        for sub_data in data['messages']:
+            self.__dispatch_message(sub_data)
+
+    def __notify(self, event: str) -> None:
+        """ Wake the Tk thread up to handle what was just queued. """
+        try:
+            self._root_window.event_generate(event, when='tail')
+        except tk.TclError:
+            pass # the window is gone; nothing is left to wake
+        except RuntimeError as e:
+            # Tk is not running its main loop yet; the grid window drains the queues once it is
+            print(f"Could not post {event}: {e}")
+
+    def __handle_grid(self, data: dict) -> None:
+        self._grid_updates.append((data['seq_num'], 'grid', (data['grid'], data['room_name'], data['position'], data['bg_music'])))
+        self.__notify(GRID_UPDATE_EVENT)
+        if 'description' in data:
+            self.insert_message(self._messages, data['room_name'])
+            self.insert_message(self._messages, data['description'])
+
+    def __handle_emote(self, data: dict) -> None:
+        self._grid_updates.append((data['seq_num'], 'emote', (data['emote'], data['emote_pos'])))
+        self.__notify(GRID_UPDATE_EVENT)
+
+    def __handle_aux(self, data: dict) -> None:
+        self._aux_queue.put(data)
+        self.__notify(WINDOW_REQUEST_EVENT)
+
+    def __handle_dialogue(self, data: dict) -> None:
+        # wrap and unpack the dialogue here, off the Tk thread
+        lines = data['dialogue_text'].split('\n')
+        short_lines = shorten_lines(lines, 35)
+        font = data.get('dialogue_font', 'pkmn')
+        bg_color = tuple(data.get('dialogue_bg_color', (255, 255, 255)))
+        text_color = tuple(data.get('dialogue_text_color', (0, 0, 0)))
+        press_enter = data.get('dialogue_press_enter', False)
+        auto_delay = data.get('dialogue_auto_delay', 500)
+
+        data['dialogue_data'] = ('\n'.join(short_lines), font, bg_color, text_color, press_enter, auto_delay)
+        self.__handle_aux(data)
+
+    def __handle_chat(self, data: dict) -> None:
+        if data.get('text', '') == 'disconnect':
+            self._root_window.destroy()
+        elif 'room_name' in data:
+            self.insert_message(self._messages, f"[{data['room_name']}] {data['handle']}: {data['text']}")
+        else:
+            self.insert_message(self._messages, f"{data['handle']}: {data['text']}")
+
+    def __handle_file(self, data: dict) -> None:
+        self.download_file(data['file_path'])
+
+    # Group 29 added these
+    # --------------------------------
+    def __handle_pokemon_battle(self, data: dict) -> None:
+        # Exatract data from the message
+        destroy = data['destroy']
+        player_data = data['player_data']
+        enemy_data = data['enemy_data']
+
+        if destroy:
+            if self._pokemon_battle_window is not None and self._pokemon_battle_window.is_open():
+                self._root_window.after(0, self._pokemon_battle_window._window.destroy)
+                self._pokemon_battle_window = None
+        elif player_data and enemy_data:
+            if self._pokemon_battle_window is None or not self._pokemon_battle_window.is_open():
+                self._pokemon_battle_window = PokemonBattleWindow(
+                    self._root_window,
+                    self,
+                    self._resource_manager,
+                    player_data,
+                    enemy_data
+                )
+                self._root_window.after(0, self._pokemon_battle_window.run)
             else:
-                self.insert_message(self._messages, f"{data['handle']}: {data['text']}")
-        elif data['classname'] == 'FileMessage':
-            self.download_file(data['file_path'])
-            
-        # Group 29 added these
-        # --------------------------------
-        elif data['classname'] == 'PokemonBattleMessage':
-            # Exatract data from the message
-            destroy = data['destroy']
-            player_data = data['player_data']
-            enemy_data = data['enemy_data']
-
-            if destroy:
-                if hasattr(self, '_pokemon_battle_window') and self._pokemon_battle_window and self._pokemon_battle_window.is_open():
-                    self._root_window.after(0, self._pokemon_battle_window._window.destroy)
-                    self._pokemon_battle_window = None
-            elif player_data and enemy_data:
-                if not hasattr(self, '_pokemon_battle_window') or self._pokemon_battle_window is None or not self._pokemon_battle_window.is_open():
-                    self._pokemon_battle_window = PokemonBattleWindow(
+                self._pokemon_battle_window.update_battle_state(player_data, enemy_data)
+
+    def __handle_options(self, data: dict) -> None:
+        # Exatract data from the message
+        options = data['options']
+        destroy = data['destroy']
+
+        if destroy:
+            if self._options_window is not None and self._options_window.is_open():
+                self._options_window._window.destroy()
+                self._options_window = None
+        elif self._options_window is not None and self._options_window.is_open():
+            self._options_window.update_options(options)
+        else:
+            self._options_window = OptionsWindow(self._root_window, self, self._resource_manager, options)
+            self._root_window.after(0, self._options_window.run)
+
+    def __handle_choose_object(self, data: dict) -> None:
+        # Exatract data from the message
+        options = data['options']  
+        window_title = data['window_title']
+        sprite_size = data['sprite_size']
+        width = data['width']
+        height = data['height']
+        gap = data['gap']
+        label_height = data['label_height']
+        offset_x = data['offset_x']
+        offset_y = data['offset_y']
+        orientation: Literal["landscape", "portrait"] = cast(Literal["landscape", "portrait"], data['orientation'])
+
+        # Spawn the generalized choose object window
+        choose_window = ChooseObjectWindow(
+            self._root_window,
+            self,
+            self._resource_manager,
+            options,
+            orientation=orientation,
+            sprite_size=sprite_size,
+            window_title=window_title,
+            width=width,
+            height=height,
+            gap=gap,
+            label_height=label_height,
+            offset_x=offset_x,
+            offset_y=offset_y
+        )
+        self._root_window.after(0, choose_window.run)
+
+    def __handle_display_stats(self, data: dict) -> None:
+        # Exatract data from the message
+        stats = data['stats']
+        top_image_path = data['top_image_path']
+        bottom_image_path = data['bottom_image_path']
+        sprite_size = data['scale']
+        window_title = data['window_title']
+
+        # Spawn display window with general stats and images
+        display_window = DisplayStatsWindow(
+            self._root_window,
+            self,
+            self._resource_manager,
+            stats,
+            top_image_path,
+            bottom_image_path,
+            sprite_size,
+            window_title
+        )
+        self._root_window.after(0, display_window.run)
+
+    ## Group 23 code ########################
+    def __handle_fest(self, data: dict) -> None:
+        fsc_render(data)
+    #####################################
+
+    def __handle_magical_key(self, data: dict) -> None:
+        magical_key_window = MagicalKeyWindow(
+            self._root_window, 
+            self,
+            self._resource_manager
+        )
+        self._root_window.after(0, magical_key_window.run)
+
+    # --------------------------------
+    # group 69 code
+    def __handle_combat_ui(self, data: dict) -> None:
+        destroy = data.get('destroy', False)
+        left_character = data.get('left_character')
+        right_character = data.get('right_character')
+        
+        if destroy:
+            self.__close_window('_combat_ui_window')
+        else:
+            if self._combat_ui_window is None:
+                try:
+                    self._combat_ui_window = CombatUIWindow(
                         self._root_window,
                         self,
                         self._resource_manager,
-                        player_data,
-                        enemy_data
+                        left_character,
+                        right_character
                     )
-                    self._root_window.after(0, self._pokemon_battle_window.run)
-                else:
-                    self._pokemon_battle_window.update_battle_state(player_data, enemy_data)
-
-        elif data['classname'] == 'OptionsMessage':
-            # Exatract data from the message
-            options = data['options']
-            destroy = data['destroy']
-
-            if destroy:
-                if hasattr(self, '_options_window') and self._options_window and self._options_window.is_open():
-                    self._options_window._window.destroy()
-                    self._options_window = None
-            elif hasattr(self, '_options_window') and self._options_window and self._options_window.is_open():
-                self._options_window.update_options(options)
-            else:
-                self._options_window = OptionsWindow(self._root_window, self, self._resource_manager, options)
-                self._root_window.after(0, self._options_window.run)
-
-        elif data['classname'] == 'ChooseObjectMessage':
-            # Exatract data from the message
-            options = data['options']  
-            window_title = data['window_title']
-            sprite_size = data['sprite_size']
-            width = data['width']
-            height = data['height']
-            gap = data['gap']
-            label_height = data['label_height']
-            offset_x = data['offset_x']
-            offset_y = data['offset_y']
-            orientation: Literal["landscape", "portrait"] = cast(Literal["landscape", "portrait"], data['orientation'])
-
-            # Spawn the generalized choose object window
-            choose_window = ChooseObjectWindow(
-                self._root_window,
-                self,
-                self._resource_manager,
-                options,
-                orientation=orientation,
-                sprite_size=sprite_size,
-                window_title=window_title,
-                width=width,
-                height=height,
-                gap=gap,
-                label_height=label_height,
-                offset_x=offset_x,
-                offset_y=offset_y
-            )
-            self._root_window.after(0, choose_window.run)
-        
-        elif data['classname'] == 'DisplayStatsMessage':
-            # Exatract data from the message
-            stats = data['stats']
-            top_image_path = data['top_image_path']
-            bottom_image_path = data['bottom_image_path']
-            sprite_size = data['scale']
-            window_title = data['window_title']
-
-            # Spawn display window with general stats and images
-            display_window = DisplayStatsWindow(
-                self._root_window,
-                self,
-                self._resource_manager,
-                stats,
-                top_image_path,
-                bottom_image_path,
-                sprite_size,
-                window_title
-            )
-            self._root_window.after(0, display_window.run)
-
-        ## Group 23 code ########################
-        elif data['classname'] == 'FestMessage':
-            fsc_render(data)
-        #####################################
-
-        elif data['classname'] == 'MagicalKeyMessage':
-            magical_key_window = MagicalKeyWindow(
-                self._root_window, 
-                self,
-                self._resource_manager
-            )
-            self._root_window.after(0, magical_key_window.run)
-
-        # --------------------------------
-        # group 69 code
-        elif data['classname'] == 'CombatUIMessage':
-            destroy = data.get('destroy', False)
-            left_character = data.get('left_character')
-            right_character = data.get('right_character')
-            
-            if destroy:
-                if hasattr(self, '_combat_ui_window') and self._combat_ui_window:
-                    self._root_window.after(0, self._combat_ui_window._window.destroy)
-                    self._combat_ui_window = None
+                    self._root_window.after(0, self._combat_ui_window.run)
+                except Exception as e:
+                    traceback.print_exc()
             else:
-                if not hasattr(self, '_combat_ui_window') or self._combat_ui_window is None:
-                    try:
-                        self._combat_ui_window = CombatUIWindow(
-                            self._root_window,
-                            self,
-                            self._resource_manager,
-                            left_character,
-                            right_character
-                        )
-                        self._root_window.after(0, self._combat_ui_window.run)
-                    except Exception as e:
-                        import traceback
-                        traceback.print_exc()
-                else:
-                    self._combat_ui_window.update_characters(left_character, right_character)
-        
-        elif data['classname'] == 'TimerMessage':
-            time_str = data.get('time_str', "03:00")
-            is_match_over = data.get('is_match_over', False)
-            destroy = data.get('destroy', False)
-            
-            if destroy:
-                if hasattr(self, '_timer_window') and self._timer_window:
-                    self._root_window.after(0, self._timer_window._window.destroy)
-                    self._timer_window = None
-            else:
-                if not hasattr(self, '_timer_window') or self._timer_window is None:
-                    try:
-                        self._timer_window = TimerWindow(
-                            self._root_window,
-                            self,
-                            time_str,
-                            is_match_over
-                        )
-                        self._root_window.after(0, self._timer_window.run)
-                    except Exception as e:
-                        print(f"ERROR: Failed to create Timer window: {e}")
-                        import traceback
-                        traceback.print_exc()
-                else:
-                    self._timer_window.update_timer(time_str, is_match_over)
+                self._combat_ui_window.update_characters(left_character, right_character)
+
+    def __handle_timer(self, data: dict) -> None:
+        time_str = data.get('time_str', "03:00")
+        is_match_over = data.get('is_match_over', False)
+        destroy = data.get('destroy', False)
         
-        elif data['classname'] == 'WinnerMessage':
-            winner_name = data.get('winner_name', 'Unknown Fighter')
-            winner_stats = data.get('winner_stats', {})
-            destroy = data.get('destroy', False)
-            
-            if destroy:
-                if hasattr(self, '_combat_result_window') and self._combat_result_window:
-                    self._root_window.after(0, self._combat_result_window._window.destroy)
-                    self._combat_result_window = None
-            else:
-                # Format fighter data for the window
-                fighter_data = {
-                    "name": winner_name,
-                    "hp": winner_stats.get("hp", 0),
-                    "max_hp": winner_stats.get("max_hp", 100)
-                }
-                
-                if not hasattr(self, '_combat_result_window') or self._combat_result_window is None:
-                    try:
-                        self._combat_result_window = CombatResultWindow(
-                            self._root_window,
-                            self,
-                            fighter_data,
-                            "win"  # This is a winner, so use "win" type
-                        )
-                        self._root_window.after(0, self._combat_result_window.run)
-                    except Exception as e:
-                        import traceback
-                        traceback.print_exc()
-            
-            # Close other windows when winner is shown
-            if hasattr(self, '_combat_ui_window') and self._combat_ui_window:
-                self._root_window.after(0, self._combat_ui_window._window.destroy)
-                self._combat_ui_window = None
-                
-            if hasattr(self, '_timer_window') and self._timer_window:
-                self._root_window.after(0, self._timer_window._window.destroy)
-                self._timer_window = None
-                
-        elif data['classname'] == 'CombatResultMessage':
-            fighter_name = data.get('fighter_name', 'Unknown Fighter')
-            fighter_stats = data.get('fighter_stats', {})
-            result_type = data.get('result_type', 'win')  # Default to win if not specified
-            destroy = data.get('destroy', False)
-            
-            if destroy:
-                if hasattr(self, '_combat_result_window') and self._combat_result_window:
-                    self._root_window.after(0, self._combat_result_window._window.destroy)
-                    self._combat_result_window = None
+        if destroy:
+            self.__close_window('_timer_window')
+        else:
+            if self._timer_window is None:
+                try:
+                    self._timer_window = TimerWindow(
+                        self._root_window,
+                        self,
+                        time_str,
+                        is_match_over
+                    )
+                    self._root_window.after(0, self._timer_window.run)
+                except Exception as e:
+                    print(f"ERROR: Failed to create Timer window: {e}")
+                    traceback.print_exc()
             else:
-                # Format fighter data for the window
-                fighter_data = {
-                    "name": fighter_name,
-                    "hp": fighter_stats.get("hp", 0),
-                    "max_hp": fighter_stats.get("max_hp", 100)
-                }
-                
-                if not hasattr(self, '_combat_result_window') or self._combat_result_window is None:
-                    try:
-                        self._combat_result_window = CombatResultWindow(
-                            self._root_window,
-                            self,
-                            fighter_data,
-                            result_type  # Use specified result type (win/lose)
-                        )
-                        self._root_window.after(0, self._combat_result_window.run)
-                    except Exception as e:
-                        import traceback
-                        traceback.print_exc()
-            
-            # Close other windows when result is shown
-            if hasattr(self, '_combat_ui_window') and self._combat_ui_window:
-                self._root_window.after(0, self._combat_ui_window._window.destroy)
-                self._combat_ui_window = None
-                
-            if hasattr(self, '_timer_window') and self._timer_window:
-                self._root_window.after(0, self._timer_window._window.destroy)
-                self._timer_window = None
-        # --------------------------------
-         # group 7 code --------------------------------------------------------------------
-        # ----------------------------------------------------------------------------------
-
-        elif data['classname'] == 'BoxingMatchMessage':
-            player_name         = data.get('player_name', 'Player')
-            npc_name            = data.get('npc_name',    'NPC')
-            player_initial_hp   = data.get('player_initial_hp', 100)
-            npc_initial_hp      = data.get('npc_initial_hp',    100)
-            turn                = data.get('turn', 0)
-
-            boxing_match_window = BoxingBattleWindow(
-                root_window      = self._root_window,
-                network_manager  = self,           
-                npc_name         = npc_name,
-                player_name      = player_name,
-                npc_initial_hp   = npc_initial_hp,
-                player_initial_hp= player_initial_hp
-            )
-            boxing_match_window.update_turn_counter(turn)
-            
-            self._root_window.after(0, boxing_match_window.run)
-        
-        elif data['classname'] == 'BattleResultMessage':
-            result = data.get('result', 'LOSE')
-            fighter_data = data.get('fighter_data', {})
-            battle_result_window = BattleResultWindow(self._root_window, result, fighter_data)
-            self._root_window.after(0, battle_result_window.run)
-
-        elif data['classname'] == 'EnduranceGameMessage':
-            time_left = data.get('time_left', 10)
-            endurance_game_window = EnduranceGameWindow(self._root_window, time_left)
-            self._root_window.after(0, endurance_game_window.run)
-        
-        elif data['classname'] == 'WeightliftingMinigameMessage':
-            difficulty = data.get('difficulty', 1.0)
-            player_email = data.get('player_email', '')
-            self._weight_window = WeightliftingMinigameWindow(
-                self._root_window,
-                self,
-                self._resource_manager,
-                difficulty,
-                player_email
-            )
-            self._root_window.after(0, self._weight_window.run)
+                self._timer_window.update_timer(time_str, is_match_over)
 
-        #end of group 7 code -----------------------------------------------------------------
-        #-------------------------------------------------------------------------------------
+    def __show_combat_result(self, fighter_name: str, fighter_stats: dict, result_type: str, destroy: bool) -> None:
+        """ Show (or close) the combat result window, closing the combat UI and timer windows. """
+        if destroy:
+            self.__close_window('_combat_result_window')
         else:
-            print(f"Bad message (unknown class name): {message}")
-        
-    def rcv_thread(self, messages: tk.Listbox, grid_updates: Queue, aux_queue: Queue) -> NoReturn:
+            # Format fighter data for the window
+            fighter_data = {
+                "name": fighter_name,
+                "hp": fighter_stats.get("hp", 0),
+                "max_hp": fighter_stats.get("max_hp", 100)
+            }
+            
+            if self._combat_result_window is None:
+                try:
+                    self._combat_result_window = CombatResultWindow(
+                        self._root_window,
+                        self,
+                        fighter_data,
+                        result_type
+                    )
+                    self._root_window.after(0, self._combat_result_window.run)
+                except Exception as e:
+                    traceback.print_exc()
+        
+        # Close other windows when result is shown
+        self.__close_window('_combat_ui_window')
+        self.__close_window('_timer_window')
+
+    def __handle_winner(self, data: dict) -> None:
+        # This is a winner, so use "win" type
+        self.__show_combat_result(data.get('winner_name', 'Unknown Fighter'), data.get('winner_stats', {}), "win", data.get('destroy', False))
+
+    def __handle_combat_result(self, data: dict) -> None:
+        # Use specified result type (win/lose), default to win if not specified
+        self.__show_combat_result(data.get('fighter_name', 'Unknown Fighter'), data.get('fighter_stats', {}),
+                                  data.get('result_type', 'win'), data.get('destroy', False))
+    # --------------------------------
+    # group 7 code --------------------------------------------------------------------
+    # ----------------------------------------------------------------------------------
+
+    def __handle_boxing_match(self, data: dict) -> None:
+        player_name         = data.get('player_name', 'Player')
+        npc_name            = data.get('npc_name',    'NPC')
+        player_initial_hp   = data.get('player_initial_hp', 100)
+        npc_initial_hp      = data.get('npc_initial_hp',    100)
+        turn                = data.get('turn', 0)
+
+        boxing_match_window = BoxingBattleWindow(
+            root_window      = self._root_window,
+            network_manager  = self,           
+            npc_name         = npc_name,
+            player_name      = player_name,
+            npc_initial_hp   = npc_initial_hp,
+            player_initial_hp= player_initial_hp
+        )
+        boxing_match_window.update_turn_counter(turn)
+        
+        self._root_window.after(0, boxing_match_window.run)
+
+    def __handle_battle_result(self, data: dict) -> None:
+        result = data.get('result', 'LOSE')
+        fighter_data = data.get('fighter_data', {})
+        battle_result_window = BattleResultWindow(self._root_window, result, fighter_data)
+        self._root_window.after(0, battle_result_window.run)
+
+    def __handle_endurance_game(self, data: dict) -> None:
+        time_left = data.get('time_left', 10)
+        endurance_game_window = EnduranceGameWindow(self._root_window, time_left)
+        self._root_window.after(0, endurance_game_window.run)
+
+    def __handle_weightlifting_minigame(self, data: dict) -> None:
+        difficulty = data.get('difficulty', 1.0)
+        player_email = data.get('player_email', '')
+        self._weight_window = WeightliftingMinigameWindow(
+            self._root_window,
+            self,
+            self._resource_manager,
+            difficulty,
+            player_email
+        )
+        self._root_window.after(0, self._weight_window.run)
+
+    #end of group 7 code -----------------------------------------------------------------
+    #-------------------------------------------------------------------------------------
+
+    def rcv_thread(self, messages: tk.Listbox, grid_updates: deque, aux_queue: Queue) -> NoReturn:
         """ A thread to receive and parse messages from the server. """
 
         self._messages = messages
@@ -624,12 +706,43 @@ class NetworkManager:
         self._aux_queue = aux_queue
 
         while True:
-            if self.__server_outbox.empty():
-                time.sleep(0.1)
-            #if len(self._aux_queue.queue) > 0:
-            #    time.sleep(1)
-            message = self.__server_outbox.get()
-            self.on_message(message)
+            # blocks until the server puts a message; the thread is a daemon, so no shutdown sentinel is needed
+            batch = [self.__server_outbox.get()]
+            # drain whatever else has already arrived (e.g. a room transition burst) before handling it
+            while len(batch) < RECEIVE_BATCH_SIZE:
+                try:
+                    batch.append(self.__server_outbox.get_nowait())
+                except Empty:
+                    break
+            for message in batch:
+                self.on_message(message)
+
+    # classname -> handler; kept on the class so subclasses that skip __init__ (e.g. the remote client) still dispatch
+    __HANDLERS: dict[str, Callable[['NetworkManager', dict], None]] = {
+        'CompositeMessage': __handle_composite,
+        'GridMessage': __handle_grid,
+        'EmoteMessage': __handle_emote,
+        'DialogueMessage': __handle_dialogue,
+        'SoundMessage': __handle_aux,
+        'MenuMessage': __handle_aux,
+        'ChatMessage': __handle_chat,
+        'ServerMessage': __handle_chat,
+        'FileMessage': __handle_file,
+        'PokemonBattleMessage': __handle_pokemon_battle,
+        'OptionsMessage': __handle_options,
+        'ChooseObjectMessage': __handle_choose_object,
+        'DisplayStatsMessage': __handle_display_stats,
+        'FestMessage': __handle_fest,
+        'MagicalKeyMessage': __handle_magical_key,
+        'CombatUIMessage': __handle_combat_ui,
+        'TimerMessage': __handle_timer,
+        'WinnerMessage': __handle_winner,
+        'CombatResultMessage': __handle_combat_result,
+        'BoxingMatchMessage': __handle_boxing_match,
+        'BattleResultMessage': __handle_battle_result,
+        'EnduranceGameMessage': __handle_endurance_game,
+        'WeightliftingMinigameMessage': __handle_weightlifting_minigame,
+    }
 
 class Window(ABC):
     """ A class to manage a window. Sets up the window and provides a base for subclasses. """
@@ -680,11 +793,17 @@ class DialogueBox(Window):
         self.__waiting_for_user = False         # New flag for waiting for user input
 
         self.__typing_speed = 50  # milliseconds per character
+        self.__type_start = 0.0
+        self.__type_job = None
 
         self.__text_font: FreeTypeFont = self.__resource_manager.get_font('pkmn')
+        self.tk_image: ImageTk.PhotoImage | None = None
+        self.__source_image: ImageTk.PhotoImage | None = None
         self.__current_font = None
         self.__bg_color = None
         self.__text_color = None
+        self.__last_bg_hex = None
+        self.__last_fg_hex = None
         self.__press_enter = None
         self.__auto_delay = 500  # default auto delay in ms
 
@@ -696,12 +815,14 @@ class DialogueBox(Window):
 
         self.__indicator_x: int = self._width - 140
         self.__indicator_y: int = self._height - 20
+        self.__indicator_visible: bool = False
 
         self._window.bind("<Return>", self.__on_return)
+        self._window.bind("<Destroy>", self.__on_destroy)
         # Ensure the window has focus so key events are captured.
         self._window.focus_set()
 
-        self.__monitor_queue()
+        self.start()
 
     def is_typing(self) -> bool:
         """ Check if the dialogue box is currently typing. """
@@ -713,49 +834,89 @@ class DialogueBox(Window):
             self.__current_text, font, self.__bg_color, self.__text_color, self.__press_enter, self.__auto_delay = self.__text_queue.get()
             self.__current_font = self.__resource_manager.get_font(font)
 
-            # change self.__border_frame to specified bg_color
-            r, g, b = self.__bg_color
-            hex_color = "#%02x%02x%02x" % (r, g, b)
-            print("Changing border color to", hex_color)
-            self.update_color(hex_color)
-            self.__border_frame.config(bg=hex_color)
-            self.__text_label.config(bg=hex_color)
-            self.__indicator_label.config(bg=hex_color)
+            # change self.__border_frame to specified bg_color (consecutive messages usually share colors)
+            hex_color = rgb_to_hex(self.__bg_color)
+            if hex_color != self.__last_bg_hex:
+                print("Changing border color to", hex_color)
+                self.update_color(hex_color)
+                self.__border_frame.config(bg=hex_color)
+                self.__text_label.config(bg=hex_color)
+                self.__indicator_label.config(bg=hex_color)
+                self.__last_bg_hex = hex_color
 
             # change text color
-            r, g, b = self.__text_color
-            hex_color = "#%02x%02x%02x" % (r, g, b)
-            self.__text_label.config(fg=hex_color)
-            self.__indicator_label.config(fg=hex_color)
+            hex_color = rgb_to_hex(self.__text_color)
+            if hex_color != self.__last_fg_hex:
+                self.__text_label.config(fg=hex_color)
+                self.__indicator_label.config(fg=hex_color)
+                self.__last_fg_hex = hex_color
 
             self.__current_index = 0
             self.__text_label.config(text="")
             self.__hide_indicator()  # Ensure indicator is hidden before typing
             self.__is_typing = True
             self.__waiting_for_user = False
-            self.__partial_text = ""
+            if self.__current_text:
+                self.__prepare_reveal()
+            # a message cut short with Return must not keep typing alongside this one
+            if self.__type_job is not None:
+                self._window.after_cancel(self.__type_job)
+            self.__type_start = time.perf_counter()
             self.__type_character()
 
+    def __prepare_reveal(self) -> None:
+        """ Render the whole message once and work out how much of each line is shown after each character. """
+        lines = self.__current_text.split('\n')
+        self.__full_image = self.__resource_manager.render_font(self.__current_font, self.__current_text, bg_color=self.__bg_color, text_color=self.__text_color)
+        self.__line_height = self.__full_image.height // len(lines)
+
+        # (line number, pixel advance) revealed once the character at that index has been typed
+        self.__reveal_steps: list[tuple[int, int]] = []
+        for line_no, line in enumerate(lines):
+            for col in range(1, len(line) + 1):
+                self.__reveal_steps.append((line_no, int(self.__current_font.getlength(line[:col]))))
+            if line_no < len(lines) - 1:
+                self.__reveal_steps.append((line_no + 1, 0)) # the newline itself
+
+        # The rendered message is uploaded to Tk once; each tick copies the newly typed strip
+        # from it into the displayed (initially blank) image, Tk photo to Tk photo.
+        previous_images = (self.tk_image, self.__source_image)
+        self.__source_image = self.__resource_manager.borrow_photoimage(self.__full_image)
+        blank = Image.new(self.__full_image.mode, self.__full_image.size, color=tuple(self.__bg_color))
+        self.tk_image = self.__resource_manager.borrow_photoimage(blank)
+        for previous_image in previous_images:
+            if previous_image is not None:
+                self.__resource_manager.return_photoimage(previous_image)
+        self.__revealed = (0, 0) # (line number, pixel advance) already copied
+        self.__text_label.config(image=self.tk_image) # type: ignore
+
     def __type_character(self) -> None:
-        """Display text one character at a time."""
+        """Display text one character at a time. Catches up by elapsed time when a tick runs late."""
+        self.__type_job = None
         if self.__current_index < len(self.__current_text):
-            # Append next character
-            next_char = self.__current_text[self.__current_index]
-
-            self.__partial_text += next_char
-            image_text = self.__resource_manager.render_font(self.__current_font, self.__partial_text, bg_color=self.__bg_color, text_color=self.__text_color)
-
-            # display image in label
-            self.tk_image = ImageTk.PhotoImage(image_text)
-            self.__text_label.config(image=self.tk_image) # type: ignore
-            self.__current_index += 1
+            elapsed_ms = (time.perf_counter() - self.__type_start) * 1000
+            target_index = min(len(self.__current_text), int(elapsed_ms // self.__typing_speed) + 1)
+
+            # Reveal the next character(s) by copying them from the pre-rendered message
+            while self.__current_index < target_index:
+                line_no, advance = self.__reveal_steps[self.__current_index]
+                revealed_line, revealed_x = self.__revealed
+                start_x = revealed_x if revealed_line == line_no else 0
+                if advance > start_x:
+                    top = line_no * self.__line_height
+                    self.tk_image.tk.call(str(self.tk_image), 'copy', str(self.__source_image), # type: ignore
+                                          '-from', start_x, top, advance, top + self.__line_height, '-to', start_x, top)
+                self.__revealed = (line_no, advance)
+                self.__current_index += 1
 
             # Schedule next character
-            self._window.after(self.__typing_speed, self.__type_character)
+            self.__type_job = self._window.after(self.__typing_speed, self.__type_character)
         else:
             # Typing complete.
             #self.__is_typing = False
             self.__show_indicator()
+            if not self.__press_enter:
+                self.__on_return(None)
             '''
             if self.__press_enter:
                 self.__show_indicator()
@@ -775,11 +936,15 @@ class DialogueBox(Window):
 
     def __show_indicator(self) -> None:
         """Show the 'Press Return to continue...' indicator."""
-        self.__indicator_label.place(x=self.__indicator_x, y=self.__indicator_y)
+        if not self.__indicator_visible:
+            self.__indicator_label.place(x=self.__indicator_x, y=self.__indicator_y)
+            self.__indicator_visible = True
 
     def __hide_indicator(self) -> None:
         """Hide the 'Press Return to continue...' indicator."""
-        self.__indicator_label.place_forget()
+        if self.__indicator_visible:
+            self.__indicator_label.place_forget()
+            self.__indicator_visible = False
 
     def __on_return(self, event) -> None:
         print("Return key pressed; queue: ", self.__text_queue.queue)
@@ -799,14 +964,18 @@ class DialogueBox(Window):
             self._window.after(self.__auto_delay, lambda: self._window.destroy())
             #self._window.destroy()
     
-    def __monitor_queue(self) -> None:
-        """Continuously monitor the queue and start processing if not already."""
-        if self.__current_index >= len(self.__current_text) and not self.__press_enter:
-            self.__on_return(None)
-        if not self.__is_typing and len(self.__text_queue.queue) > 0:
-            self.start()
-        # Check again after a short delay
-        self._window.after(10, self.__monitor_queue)
+    def __on_destroy(self, event) -> None:
+        """Give the borrowed text images back once the window itself (not one of its children) is destroyed."""
+        if event.widget is not self._window:
+            return
+        if self.__type_job is not None:
+            self._window.after_cancel(self.__type_job)
+            self.__type_job = None
+        for image in (self.tk_image, self.__source_image):
+            if image is not None:
+                self.__resource_manager.return_photoimage(image)
+        self.tk_image = None
+        self.__source_image = None
 
     def run(self):
         """Start the Tkinter main loop."""
@@ -880,6 +1049,7 @@ class GridWindow(Window):
 
         def handle_sigint(signum, frame):
             self.__on_closing()
+            time.sleep(0.1) # the process exits right away, so give the server a moment to see the disconnect
             sys.exit(0)
         signal.signal(signal.SIGINT, handle_sigint)
         root_window.protocol("WM_DELETE_WINDOW", self.__on_closing)
@@ -892,12 +1062,17 @@ class GridWindow(Window):
         self.__cur_grid = None
         self.__cur_room_name = None
         self.__image_refs = defaultdict(list)
-        self.__grid_updates = PriorityQueue()
+        self.__grid_updates: deque = deque() # appended by the network thread, drained by the Tk thread
         #self.drawn_players = {}
         #self.movements = Queue() # TODO: Dict of queues for each sprite.
         self.__emotes = Queue()
         self.__emote_refs = {}
-        self.__THROTTLE_INTERVAL = 0.05
+        self.__emote_expiry: list[tuple[float, int, tuple[int, int]]] = [] # heap of (expiry time, canvas item, position)
+        self.__emote_timer = None
+        self.__tile_items: dict[tuple[int, int, int], tuple[int, str, int]] = {}
+        self.__camera: tuple[int, int] | None = None
+        self.__handling_window_requests = False
+        self.__THROTTLE_INTERVAL_NS = 50_000_000 # 0.05 s
 
         self.__canvas = self.__create_canvases()
         self.__message_window = MessageWindow(root_window, network_manager)
@@ -909,13 +1084,32 @@ class GridWindow(Window):
         self.__rcv_t = threading.Thread(target=network_manager.rcv_thread, args=(self.__message_window.get_messages(), self.__grid_updates, self.__aux_queue))
         self.__rcv_t.daemon = True
 
+        # (sound_file, volume, repeat) to play, or None to stop; handled in order by one audio thread
+        self.__sound_queue: Queue = Queue()
+        self.__sound_t = threading.Thread(target=self.__play_sounds)
+        self.__sound_t.daemon = True
+
+    def __play_sounds(self) -> NoReturn:
+        """ A thread to play the sounds requested by the server, one after the other. """
+        while True:
+            request = self.__sound_queue.get()
+            try:
+                if request is None:
+                    AudioPlayer.stop_sound()
+                else:
+                    sound_file, volume, repeat = request
+                    AudioPlayer.set_sound(sound_file)
+                    AudioPlayer.play_sound(volume, repeat)
+            except:
+                print(traceback.format_exc())
+
     def __on_closing(self):
         print("Disconnecting from server")
         self.__network_manager.send({
             'type': 'disconnect',
         })
-        time.sleep(0.1)
-        self.__root_window.destroy()
+        # keep the event loop running while the server handles the disconnect, then close
+        self.__root_window.after(100, self.__root_window.destroy)
 
     def __create_canvases(self) -> tk.Canvas:
         frm_main = tk.Frame(master=self._window, borderwidth=0, relief='flat', highlightthickness=0)
@@ -939,12 +1133,11 @@ class GridWindow(Window):
 
         # when users press the arrow keys when the image_label has focus, the command should be sent to the server
         def send_command(event):
-            current_time = time.time()
+            current_time = time.perf_counter_ns()
         
             # Check if enough time has passed since the last move
-            if current_time - self.__last_move_time < self.__THROTTLE_INTERVAL:
-                # Throttle: ignore this keypress
-                print(f"Ignored {event.keysym} keypress to throttle.")
+            if current_time - self.__last_move_time < self.__THROTTLE_INTERVAL_NS:
+                # Throttle: ignore this keypress (silently; key autorepeat hits this many times a second)
                 return
 
             # Update the last move time
@@ -976,10 +1169,15 @@ class GridWindow(Window):
         camera_x = max(0, min(desired_camera_x, grid_width  - camera_width))
         camera_y = max(0, min(desired_camera_y, grid_height - camera_height))
 
-        # Clear the (second) canvas
         new_image_refs = defaultdict(list)
 
-        self.__canvas.delete("all")
+        # Items already on the canvas follow the camera in a single call instead of being redrawn
+        if self.__camera is not None and self.__camera != (camera_x, camera_y):
+            self.__canvas.move(TILE_TAG, (self.__camera[0] - camera_x) * TILE_SIZE, (self.__camera[1] - camera_y) * TILE_SIZE)
+        self.__camera = (camera_x, camera_y)
+
+        # emotes do not outlive a redraw
+        self.__canvas.delete(EMOTE_TAG)
 
         PADDING = 6
         row_start = max(0, camera_y - PADDING)
@@ -988,35 +1186,67 @@ class GridWindow(Window):
         col_start = max(0, camera_x - PADDING)
         col_end   = min(grid_width, camera_x + camera_width + PADDING)
 
-        to_draw = []
+        # Only touch the canvas items that changed: (tile_col, tile_row, index in cell) -> (image_id, image_name, z_index)
+        old_items = self.__tile_items
+        tile_items = {}
+        # keys of the items that were created or changed layer and have to be put back in draw order
+        unplaced = set()
+        get_image = self.__resource_manager.get_image
+        # most tiles repeat a handful of images, so each name is resolved once per frame:
+        # image_name -> (image, y offset); characters are drawn one tile above their cell
+        frame_images = {}
+        # Draw the tiles. The key is the canvas offset, which only depends on the column/row:
+        col_offsets = [(tile_col, (tile_col - camera_x) * TILE_SIZE) for tile_col in range(col_start, col_end)]
         for tile_row in range(row_start, row_end):
-            for tile_col in range(col_start, col_end):
-                # Draw the tile. The key is the canvas offset:
-                canvas_x = (tile_col - camera_x) * TILE_SIZE
-                canvas_y = (tile_row - camera_y) * TILE_SIZE
-
-                cell = new_grid[tile_row][tile_col]  # list of (image_name, z_index)
-                for (image_name, z_index) in cell:
+            canvas_y = (tile_row - camera_y) * TILE_SIZE
+            grid_row = new_grid[tile_row]
+            for tile_col, canvas_x in col_offsets:
+                cell = grid_row[tile_col]  # list of (image_name, z_index)
+                for index, (image_name, z_index) in enumerate(cell):
                     if not image_name:
                         continue
-                    image = self.__resource_manager.get_image(image_name)
+                    resolved = frame_images.get(image_name)
+                    if resolved is None:
+                        resolved = frame_images[image_name] = (get_image(image_name), -TILE_SIZE if 'character/' in image_name else 0)
+                    image, y_offset = resolved
 
                     # On-canvas position
-                    canvas_x = (tile_col - camera_x) * TILE_SIZE
-                    canvas_y = (tile_row - camera_y) * TILE_SIZE
-                    if 'character/' in image_name:
-                        canvas_y -= TILE_SIZE
-                    
-                    to_draw.append((canvas_x, canvas_y, image, z_index, image_name, tile_col, tile_row))
-        
-
-        # Sort by z_index
-        to_draw.sort(key=lambda x: x[3])
-        for canvas_x, canvas_y, image, z_index, image_name, tile_col, tile_row in to_draw:
-            image_id = self.__canvas.create_image(canvas_x, canvas_y, image=image, anchor=tk.NW)
-            #if z_index <= -1:
-            #    self.__canvas2.tag_lower(image_id)
-            new_image_refs[(tile_col, tile_row)].append((image, image_id, image_name))
+                    item_y = canvas_y + y_offset
+
+                    key = (tile_col, tile_row, index)
+                    old_item = old_items.pop(key, None)
+                    if old_item is None:
+                        image_id = self.__canvas.create_image(canvas_x, item_y, image=image, anchor=tk.NW, tags=TILE_TAG)
+                        unplaced.add(key)
+                    else:
+                        image_id, old_name, old_z = old_item
+                        if old_name != image_name:
+                            self.__canvas.itemconfig(image_id, image=image)
+                            if ('character/' in old_name) != (y_offset != 0):
+                                self.__canvas.coords(image_id, canvas_x, item_y)
+                        if old_z != z_index:
+                            unplaced.add(key)
+
+                    tile_items[key] = (image_id, image_name, z_index)
+                    new_image_refs[(tile_col, tile_row)].append((image, image_id, image_name))
+
+        # Whatever is left scrolled out of view or is gone from the grid
+        if old_items:
+            self.__canvas.delete(*(image_id for image_id, _, _ in old_items.values()))
+        self.__tile_items = tile_items
+
+        # New items are created on top. Items are stacked by z_index, then row-major within a layer;
+        # the others are already in that order, so each unplaced item goes right above its predecessor.
+        if unplaced:
+            below = None
+            for key in sorted(tile_items, key=lambda key: (tile_items[key][2], key[1], key[0], key[2])):
+                image_id = tile_items[key][0]
+                if key in unplaced:
+                    if below is None:
+                        self.__canvas.tag_lower(image_id)
+                    else:
+                        self.__canvas.tag_raise(image_id, below)
+                below = image_id
 
         return new_image_refs, movements
     
@@ -1156,64 +1386,97 @@ class GridWindow(Window):
     '''
     
     def __draw_emotes(self) -> None:
-        def delete_emote(emote_id, pos):
-            self.__canvas.delete(emote_id)
-            del self.__emote_refs[pos]
-        
         def draw_emote():
+            get_image = self.__resource_manager.get_image
             while not self.__emotes.empty():
                 emote, (i, j) = self.__emotes.get()
                 i -= 1
                 print("Drawing emote", emote, "at", i, j)
-                image = self.__resource_manager.get_image(f'emote/{emote}')
-                image_id = self.__canvas.create_image(j*TILE_SIZE, i*TILE_SIZE, image=image, anchor=tk.NW)
+                image = get_image(f'emote/{emote}')
+                image_id = self.__canvas.create_image(j*TILE_SIZE, i*TILE_SIZE, image=image, anchor=tk.NW, tags=EMOTE_TAG)
                 self.__emote_refs[(i, j)] = image_id
                 self.__canvas.tag_raise(image_id)
-                self.__canvas.after(2000, delete_emote, image_id, (i, j))
+                heapq.heappush(self.__emote_expiry, (time.monotonic() + EMOTE_DURATION, image_id, (i, j)))
         
         try:
             draw_emote()
         except:
             print(traceback.format_exc())
-        self._window.after(16, self.__draw_emotes)
-
-    def __check_for_grid_updates(self) -> None:
+        self.__schedule_emote_expiry()
+
+    def __schedule_emote_expiry(self) -> None:
+        """ Make sure a single timer is pending for the emote that expires first. """
+        if self.__emote_timer is None and self.__emote_expiry:
+            delay_ms = max(0, int((self.__emote_expiry[0][0] - time.monotonic()) * 1000) + 1)
+            self.__emote_timer = self.__canvas.after(delay_ms, self.__expire_emotes)
+
+    def __expire_emotes(self) -> None:
+        """ Remove every emote whose time is up, then wait for the next one. """
+        self.__emote_timer = None
+        now = time.monotonic()
+        while self.__emote_expiry and self.__emote_expiry[0][0] <= now:
+            _, image_id, pos = heapq.heappop(self.__emote_expiry)
+            self.__canvas.delete(image_id)
+            if self.__emote_refs.get(pos) == image_id:
+                del self.__emote_refs[pos]
+        self.__schedule_emote_expiry()
+
+    def __check_for_grid_updates(self, event=None) -> None:
         try:
-            # get all elements from the grid_updates queue
-            while not self.__grid_updates.empty():
-                timestamp, update_type, data = self.__grid_updates.get()
+            # get all elements from the grid_updates queue; only the newest grid frame and
+            # the newest emote per tile are drawn, older ones would be painted over anyway
+            grid_updates = self.__grid_updates
+            updates = []
+            while grid_updates:
+                updates.append(grid_updates.popleft())
+            # the server numbers its messages; apply them in that order in case any arrived out of order
+            updates.sort(key=itemgetter(0))
+
+            latest_grid = None
+            emotes = {}
+            for timestamp, update_type, data in updates:
                 if update_type == 'grid':
-                    new_grid, room_name, position, bg_music = data
-                    if self.__cur_room_name != room_name:
-                        AudioPlayer.stop_sound()
-                        if len(bg_music) > 0:
-                            sound_file = self.__resource_manager.get_sound(bg_music)
-                            
-                            AudioPlayer.set_sound(sound_file)
-
-                            # Start playing the sound in a separate thread
-                            play_thread = threading.Thread(target=AudioPlayer.play_sound, args=(0.5,True))
-                            play_thread.start()
-
-                    self.__image_refs, movements = self.__draw_grid(self.__cur_grid, new_grid, self.__image_refs, self.__cur_room_name, room_name, position)
-
-                    #print("Movements:", movements)
-                    #for movement in movements:
-                    #    self.movements.put(movement)
-                    self.__cur_grid = new_grid
-                    self.__cur_room_name = room_name
+                    latest_grid = data
                 elif update_type == 'emote':
-                    self.__emotes.put(data)
+                    emotes[tuple(data[1])] = data
                 else:
                     raise ValueError(f"Invalid update type: {update_type}")
+
+            if latest_grid is not None:
+                new_grid, room_name, position, bg_music = latest_grid
+                if self.__cur_room_name != room_name:
+                    self.__sound_queue.put(None)
+                    if len(bg_music) > 0:
+                        sound_file = self.__resource_manager.get_sound(bg_music)
+
+                        # Start playing the sound on the audio thread
+                        self.__sound_queue.put((sound_file, 0.5, True))
+
+                self.__image_refs, movements = self.__draw_grid(self.__cur_grid, new_grid, self.__image_refs, self.__cur_room_name, room_name, position)
+
+                #print("Movements:", movements)
+                #for movement in movements:
+                #    self.movements.put(movement)
+                self.__cur_grid = new_grid
+                self.__cur_room_name = room_name
+
+            for data in emotes.values():
+                self.__emotes.put(data)
         except:
             print(traceback.format_exc())
-        self._window.after(16, self.__check_for_grid_updates)
+        if not self.__emotes.empty():
+            self.__draw_emotes()
 
-    def __check_for_window_requests(self) -> None:
+    def __check_for_window_requests(self, event=None) -> None:
+        # Menus and dialogues run a nested event loop until they close, during which this handler
+        # can fire again; the outer call keeps draining the queue, so a nested call has nothing to do.
+        if self.__handling_window_requests:
+            return
+        self.__handling_window_requests = True
         try:
-            while not self.__aux_queue.empty():
-                data = self.__aux_queue.get()
+            aux_queue = self.__aux_queue
+            while not aux_queue.empty():
+                data = aux_queue.get()
                 print("Parsing aux queue data:", data)
                 if data['classname'] == 'MenuMessage':
                     menu_name, menu_options = data['menu_name'], data['menu_options']
@@ -1224,30 +1487,15 @@ class GridWindow(Window):
                     sound_file = self.__resource_manager.get_sound(sound_path)
                     volume = data.get('volume', 0.5)
                     repeat = data.get('repeat', False)
-                    
-                    AudioPlayer.set_sound(sound_file)
 
-                    # start playing the sound in a separate thread
-                    play_thread = threading.Thread(target=AudioPlayer.play_sound, args=(volume,repeat,))
-                    play_thread.start()
+                    # start playing the sound on the audio thread
+                    self.__sound_queue.put((sound_file, volume, repeat))
                 elif data['classname'] == 'DialogueMessage':
-                    def extract_dialogue_data(data):
-                        lines = data['dialogue_text'].split('\n')
-                        short_lines = shorten_lines(lines, 35)
-                        font = data.get('dialogue_font', 'pkmn')
-                        bg_color = tuple(data.get('dialogue_bg_color', (255, 255, 255)))
-                        text_color = tuple(data.get('dialogue_text_color', (0, 0, 0)))
-                        press_enter = data.get('dialogue_press_enter', False)
-                        auto_delay = data.get('dialogue_auto_delay', 500)
-                        # TODO: Add npc_name and dialogue_image.
-                        
-                        dialogue_data = (('\n'.join(short_lines), font, bg_color, text_color, press_enter, auto_delay))
-                        return dialogue_data
-
-                    dialogue_datas = [extract_dialogue_data(data)]
-                    while len(self.__aux_queue.queue) > 0 and self.__aux_queue.queue[0]['classname'] == 'DialogueMessage':
-                        elmt = self.__aux_queue.get()
-                        dialogue_datas.append(extract_dialogue_data(elmt))
+                    # the network thread already prepared the text (see NetworkManager.__handle_dialogue)
+                    dialogue_datas = [data['dialogue_data']]
+                    while len(aux_queue.queue) > 0 and aux_queue.queue[0]['classname'] == 'DialogueMessage':
+                        elmt = aux_queue.get()
+                        dialogue_datas.append(elmt['dialogue_data'])
 
                     dialogue_window = DialogueBox(self.__root_window, self.__resource_manager, dialogue_datas)
                     dialogue_window.run()
@@ -1258,13 +1506,18 @@ class GridWindow(Window):
 
         except:
             print(traceback.format_exc())
-        self._window.after(64, self.__check_for_window_requests)
+        finally:
+            self.__handling_window_requests = False
 
     def start(self) -> None:
+        # the network thread posts these events after queueing updates, so nothing has to poll the queues
+        self.__root_window.bind(GRID_UPDATE_EVENT, self.__check_for_grid_updates)
+        self.__root_window.bind(WINDOW_REQUEST_EVENT, self.__check_for_window_requests)
+        # drain once when the main loop starts, in case an event was posted before it was running
+        self.__root_window.after_idle(self.__check_for_grid_updates)
+        self.__root_window.after_idle(self.__check_for_window_requests)
+        self.__sound_t.start()
         self.__rcv_t.start()
-        self._window.after(32, self.__check_for_grid_updates)
-        self._window.after(16, self.__draw_emotes)
-        self._window.after(66, self.__check_for_window_requests)
         #self.window.after(16, self.animate)
         self._window.mainloop()
 
@@ -1274,6 +1527,7 @@ class MenuWindow(Window):
         self.__menu_options = options
         self.__network_manager = network_manager
         self.__resource_manager = resource_manager
+        self.__font = resource_manager.get_font('pkmn')
         self.__selected_index = 0
 
         super().__init__(root_window, title="Menu", width=GRID_WIDTH//2, height=GRID_HEIGHT//2, offset_x=GRID_WIDTH//4, offset_y=GRID_HEIGHT//4)
@@ -1285,6 +1539,7 @@ class MenuWindow(Window):
         self._window.bind("<Up>", self.__on_up)
         self._window.bind("<Down>", self.__on_down)
         self._window.bind("<Return>", self.__on_return)
+        self._window.bind("<Destroy>", self.__on_destroy)
 
         # Ensure the window has focus so key events are captured.
         self._window.focus_set()
@@ -1294,8 +1549,8 @@ class MenuWindow(Window):
         option_labels, images = [], {}
         for index, option in enumerate(self.__menu_options):
             prefix = "X " if index == self.__selected_index else "  "
-            label_image = self.__resource_manager.render_font(self.__resource_manager.get_font('pkmn'), prefix + option)
-            tk_image = ImageTk.PhotoImage(label_image)
+            label_image = self.__resource_manager.render_font(self.__font, prefix + option)
+            tk_image = self.__resource_manager.borrow_photoimage(label_image)
             label = tk.Label(self._window,
                              image=tk_image,
                              anchor="w",
@@ -1306,26 +1561,31 @@ class MenuWindow(Window):
             images[index] = tk_image
         return option_labels, images
 
-    def __update_labels(self):
-        """Refresh the label text so that the selected option is marked with an X."""
-        for index, label in enumerate(self.__option_labels):
-            prefix = "X " if index == self.__selected_index else "  "
-            label_image = self.__resource_manager.render_font(self.__resource_manager.get_font('pkmn'), prefix + self.__menu_options[index])
-            tk_image = ImageTk.PhotoImage(label_image)
-            label.config(image=tk_image)
-            self.__image_refs[index] = tk_image
+    def __update_label(self, index: int) -> None:
+        """Refresh one label so that it is marked with an X if it is the selected option."""
+        prefix = "X " if index == self.__selected_index else "  "
+        label_image = self.__resource_manager.render_font(self.__font, prefix + self.__menu_options[index])
+        tk_image = self.__resource_manager.borrow_photoimage(label_image)
+        self.__option_labels[index].config(image=tk_image)
+        self.__resource_manager.return_photoimage(self.__image_refs[index])
+        self.__image_refs[index] = tk_image
+
+    def __select(self, index: int) -> None:
+        """Move the selection; only the previously and newly selected labels change."""
+        previous_index = self.__selected_index
+        self.__selected_index = index
+        self.__update_label(previous_index)
+        self.__update_label(index)
 
     def __on_up(self, event):
         """Move the selection up."""
         if self.__selected_index > 0:
-            self.__selected_index -= 1
-            self.__update_labels()
+            self.__select(self.__selected_index - 1)
 
     def __on_down(self, event):
         """Move the selection down."""
         if self.__selected_index < len(self.__menu_options) - 1:
-            self.__selected_index += 1
-            self.__update_labels()
+            self.__select(self.__selected_index + 1)
 
     def __on_return(self, event):
         """Send the selected option and close the window."""
@@ -1335,6 +1595,14 @@ class MenuWindow(Window):
         })
         self._window.destroy()
 
+    def __on_destroy(self, event):
+        """Give the borrowed option images back once the window itself (not one of its children) is destroyed."""
+        if event.widget is not self._window:
+            return
+        for tk_image in self.__image_refs.values():
+            self.__resource_manager.return_photoimage(tk_image)
+        self.__image_refs.clear()
+
     def run(self):
         """Start the Tkinter main loop."""
         self.__root_window.wait_window(self._window)
@@ -1422,6 +1690,9 @@ class BoxingBattleWindow(Window):
 
         self.log_text = tk.Text(self.log_frame, height=3, bg="lightgray", fg="black", state="disabled")
         self.log_text.pack(fill="both", padx=10, pady=5)
+        self.__log_pending: list[str] = []  # lines waiting for the next idle flush
+        self.__pending_state: dict[str, Any] = {}  # latest widget values waiting for the next idle flush
+        self.__flush_scheduled = False
 
         # ============== BOTTOM FRAME (Player info & moves) ==============
         self.bottom_frame = tk.Frame(self._window, bg="white", height=160)
@@ -1469,20 +1740,47 @@ class BoxingBattleWindow(Window):
 
     def update_npc_hp(self, new_hp: int):
         self.npc_current_hp = max(0, min(new_hp, self.npc_max_hp))
-        self.npc_hp_bar["value"] = self.npc_current_hp
+        self.__pending_state["npc_hp"] = self.npc_current_hp
+        self.__schedule_flush()
 
     def update_player_hp(self, new_hp: int):
         self.player_current_hp = max(0, min(new_hp, self.player_max_hp))
-        self.player_hp_bar["value"] = self.player_current_hp
+        self.__pending_state["player_hp"] = self.player_current_hp
+        self.__schedule_flush()
 
     def update_turn_counter(self, turn: int):
-        self.turn_counter_label.config(text=f"Turn: {turn}")
+        self.__pending_state["turn"] = turn
+        self.__schedule_flush()
 
     def append_log(self, text: str):
-        self.log_text.config(state="normal")
-        self.log_text.insert("end", text + "\n")
-        self.log_text.see("end")
-        self.log_text.config(state="disabled")
+        self.__log_pending.append(text)
+        self.__schedule_flush()
+
+    def __schedule_flush(self):
+        """Apply pending updates once the event loop goes idle, so a burst of server messages touches each widget once."""
+        if not self.__flush_scheduled:
+            self.__flush_scheduled = True
+            self._window.after_idle(self.__flush)
+
+    def __flush(self):
+        """Apply the latest value of every changed widget, and write every line logged since the last flush."""
+        pending = self.__pending_state
+        if "npc_hp" in pending:
+            self.npc_hp_bar["value"] = pending["npc_hp"]
+        if "player_hp" in pending:
+            self.player_hp_bar["value"] = pending["player_hp"]
+        if "turn" in pending:
+            self.turn_counter_label.config(text=f"Turn: {pending['turn']}")
+        pending.clear()
+
+        if self.__log_pending:
+            # single enable/insert/disable for all the lines
+            self.log_text.config(state="normal")
+            self.log_text.insert("end", "\n".join(self.__log_pending) + "\n")
+            self.log_text.see("end")
+            self.log_text.config(state="disabled")
+            self.__log_pending.clear()
+        self.__flush_scheduled = False
 
     def run(self):
         """Show and raise the window."""
@@ -1525,6 +1823,8 @@ class EnduranceGameWindow(Window):
         self.time_left = time_left
         self.click_count = 0
         self.timer_started = False
+        self.__end_id = None
+        self.__tick_id = None
         self.timer_label = tk.Label(self._window, text=f"Time: {self.time_left}", font=("Arial", 24))
         self.timer_label.pack(pady=20)
         self.click_button = tk.Button(self._window, text="Click as fast as you can!", font=("Arial", 20), command=self.button_clicked)
@@ -1534,22 +1834,30 @@ class EnduranceGameWindow(Window):
         self.click_count += 1
         if not self.timer_started:
             self.timer_started = True
-            self.countdown()
+            # one timer decides when the game ends; the per-second tick only refreshes the label
+            self.__end_id = self._window.after(self.time_left * 1000, self.end_game)
+            self.__tick_id = self._window.after(1000, self.countdown)
 
     def countdown(self):
+        self.time_left -= 1
         if self.time_left > 0:
             self.timer_label.config(text=f"Time: {self.time_left}")
-            self.time_left -= 1
-            self._window.after(1000, self.countdown)
+            self.__tick_id = self._window.after(1000, self.countdown)
         else:
-            self.end_game()
+            self.__tick_id = None
 
     def end_game(self):
+        for job in (self.__tick_id, self.__end_id):
+            if job is not None:
+                self._window.after_cancel(job)
+        self.__tick_id = self.__end_id = None
         self.click_button.pack_forget()
         self.timer_label.config(text=f"Clicks: {self.click_count}")
 
     def run(self):
-        self._window.mainloop()
+        """Show and raise the window."""
+        self._window.deiconify()
+        self._window.lift()
 
 class WeightliftingMinigameWindow(Window):
     def __init__(self, root_window, network_manager, resource_manager, difficulty: float, player_email: str):
@@ -1572,15 +1880,25 @@ class WeightliftingMinigameWindow(Window):
         self.__CANVAS_WIDTH = 400
         self.__SLIDER_WIDTH = 10
         self.__TARGET_BASE_WIDTH = 80
-        self.__BASE_SPEED = 3
+        self.__BASE_SPEED = 150  # canvas units per second
+        self.__FRAME_MS = 33
+        self.__BAR_LEFT = (self.__CANVAS_WIDTH - 300) // 2
+        self.__TRACK_LENGTH = 300 - self.__SLIDER_WIDTH  # distance the slider can travel along the bar
         
         # Game state
         self.__game_active = False
         self.__score = 0
-        self.__target_position = 0
+        # The target depends only on the difficulty, which is fixed for the window's lifetime
+        self.__target_width = int(self.__TARGET_BASE_WIDTH - (self.__current_difficulty * 10))
+        self.__target_position = (self.__CANVAS_WIDTH - self.__target_width) // 2
         self.__slider_position = 0
         self.__slider_direction = 1
-        self.__slider_speed = self.__BASE_SPEED + self.__current_difficulty * 1.5
+        self.__slider_speed = self.__BASE_SPEED + self.__current_difficulty * 75
+        self.__last_t = 0.0
+        self.__time_to_bounce = 0.0  # seconds until the slider reaches the edge it is heading for
+        # Hit-test bounds
+        self.__target_center = self.__target_position + self.__target_width/2
+        self.__half_target_width = self.__target_width/2
         
         # UI setup
         self.__setup_ui()
@@ -1620,16 +1938,14 @@ class WeightliftingMinigameWindow(Window):
         self.__canvas.pack(pady=20)
         
         # Draw the progress bar background
-        bar_left = (self.__CANVAS_WIDTH - 300) // 2
+        bar_left = self.__BAR_LEFT
         bar_right = bar_left + 300
         self.__canvas.create_rectangle(bar_left, 80, bar_right, 120, fill="#330000", outline="#660000")
         
         # Draw target zone
-        target_width = int(self.__TARGET_BASE_WIDTH - (self.__current_difficulty * 10))
-        self.__target_position = (self.__CANVAS_WIDTH - target_width) // 2
         self.__target = self.__canvas.create_rectangle(
             self.__target_position, 80,
-            self.__target_position + target_width, 120,
+            self.__target_position + self.__target_width, 120,
             fill="#00aa00", outline=""
         )
         
@@ -1669,19 +1985,15 @@ class WeightliftingMinigameWindow(Window):
         self.__update_score()
         self.__start_button.pack_forget()
         
-        # Set target width based on current difficulty
-        target_width = int(self.__TARGET_BASE_WIDTH - (self.__current_difficulty * 10))
-        self.__target_position = (self.__CANVAS_WIDTH - target_width) // 2
-        
-        # Update target display
-        self.__canvas.coords(
-            self.__target,
-            self.__target_position, 80,
-            self.__target_position + target_width, 120
-        )
-        
         # Start animation
+        self.__last_t = time.perf_counter()
+        self.__plan_bounce()
         self.__animate_slider()
+
+    def __plan_bounce(self):
+        """Work out how long the slider can keep going before it reaches an edge."""
+        distance = self.__TRACK_LENGTH - self.__slider_position if self.__slider_direction == 1 else self.__slider_position
+        self.__time_to_bounce = distance / self.__slider_speed
     
     def __update_score(self):
         """Update the score display and check for completion"""
@@ -1695,41 +2007,42 @@ class WeightliftingMinigameWindow(Window):
         if not self.__game_active:
             return
             
-        bar_left = (self.__CANVAS_WIDTH - 300) // 2
-        bar_right = bar_left + 300 - self.__SLIDER_WIDTH
-        
+        # Step by elapsed time so the slider speed doesn't depend on how promptly Tk runs us
+        now = time.perf_counter()
+        dt = min(now - self.__last_t, 0.1)  # don't jump across the bar after a stall
+        self.__last_t = now
+
         # Update slider position
-        self.__slider_position += self.__slider_speed * self.__slider_direction
-        
-        # Reverse direction at edges
-        if self.__slider_position <= 0:
-            self.__slider_position = 0
-            self.__slider_direction = 1
-        elif self.__slider_position >= bar_right - bar_left:
-            self.__slider_position = bar_right - bar_left
-            self.__slider_direction = -1
+        previous_position = self.__slider_position
+        self.__slider_position += self.__slider_speed * self.__slider_direction * dt
+        self.__time_to_bounce -= dt
+
+        # Only check the edges once the planned bounce is due
+        if self.__time_to_bounce <= 0:
+            # Reverse direction at edges
+            if self.__slider_position <= 0:
+                self.__slider_position = 0
+                self.__slider_direction = 1
+            elif self.__slider_position >= self.__TRACK_LENGTH:
+                self.__slider_position = self.__TRACK_LENGTH
+                self.__slider_direction = -1
+            self.__plan_bounce()
             
         # Update slider position on canvas
-        self.__canvas.coords(
-            self.__slider,
-            bar_left + self.__slider_position, 70,
-            bar_left + self.__slider_position + self.__SLIDER_WIDTH, 130
-        )
+        self.__canvas.move(self.__slider, self.__slider_position - previous_position, 0)
         
         # Continue animation
-        self._window.after(20, self.__animate_slider)
+        self._window.after(self.__FRAME_MS, self.__animate_slider)
 
     def __handle_key_press(self, event=None):
         """Handle the key press to attempt a lift"""
         if not self.__game_active:
             return
             
-        slider_center = (self.__CANVAS_WIDTH - 300) // 2 + self.__slider_position + self.__SLIDER_WIDTH/2
-        target_width = int(self.__TARGET_BASE_WIDTH - (self.__current_difficulty * 10))
-        target_center = self.__target_position + target_width/2
+        slider_center = self.__BAR_LEFT + self.__slider_position + self.__SLIDER_WIDTH/2
         
         # Check if slider is in target zone
-        if abs(slider_center - target_center) < target_width/2:
+        if abs(slider_center - self.__target_center) < self.__half_target_width:
             # Successful lift
             self.__score += 1
             self.__update_score()
@@ -1773,8 +2086,9 @@ class WeightliftingMinigameWindow(Window):
         self.__start_button.pack(pady=10)
         
     def run(self):
-        """Start the window's main loop"""
-        self._window.mainloop()
+        """Show and raise the window."""
+        self._window.deiconify()
+        self._window.lift()
 #END OF GROUP 7 ADDITIONS ------------------------------------------------
 # ------------------------------------------------------------------------
 
@@ -1786,6 +2100,8 @@ class PokemonBattleWindow(Window):
 
     Shows sprites, HP bars, names and levels, and handles hit animations.
     """
+    NAME_CACHE_LIMIT = 16
+
     def __init__(self, root_window: tk.Tk, network_manager: NetworkManager, resource_manager: ResourceManager,
                  player_data: dict, enemy_data: dict) -> None:
         super().__init__(root_window, title="Battle", width=525, height=270, offset_x=-540, offset_y=-150)
@@ -1804,80 +2120,164 @@ class PokemonBattleWindow(Window):
         self.__prev_player_name = player_data["name"]
         self.__prev_enemy_name = enemy_data["name"]
 
-        self.__image_refs = []  # prevent images from being garbage collected
+        # image currently shown for each canvas role, so Tk's images aren't garbage collected; redrawing a role replaces its entry
+        self.__image_refs: dict[str, ImageTk.PhotoImage] = {}
+        self.__items: dict[str, int] = {}  # canvas role -> its persistent image item
+        # sprites and their white damage flashes only depend on (name, back, resize), so build each once
+        self.__sprite_cache: dict[tuple[str, bool, tuple[int, int]], ImageTk.PhotoImage] = {}
+        self.__flash_cache: dict[tuple[str, bool, tuple[int, int]], ImageTk.PhotoImage] = {}
+        # (name, level, align) -> (label image, x adjustment); labels only change on level-up or switch
+        self.__name_cache: OrderedDict[tuple[str, int, str], tuple[ImageTk.PhotoImage, int]] = OrderedDict()
+        self.__mask_cache: dict[tuple[int, int], Image.Image] = {}  # label size -> rounded-corner alpha mask
+        # rounded percentage -> health bar image, resolved once per bar
+        self.__hp_bar_images: dict[int, ImageTk.PhotoImage] = {}
+        self.__hp_bar_shown: dict[str, int] = {}  # bar tag -> rounded percentage currently on the canvas
+
+        # Flash overlays are prepared off the Tk thread as soon as a new sprite is scaled; None stops the worker
+        self.__prescale_queue: Queue = Queue()
+        self.__prescale_t = threading.Thread(target=self.__prescale_flashes)
+        self.__prescale_t.daemon = True
+        self.__prescale_t.start()
 
         self.__canvas = tk.Canvas(self._window, width=525, height=270)
         self.__canvas.pack(fill="both", expand=True)
+        self._window.bind("<Destroy>", self.__on_destroy)
 
         self.__load_images()
 
+    def __on_destroy(self, event):
+        """Stop the pre-scaling worker once the window itself (not one of its children) is destroyed."""
+        if event.widget is self._window:
+            self.__prescale_queue.put(None)
+
+    def __prescale_flashes(self) -> None:
+        """A thread that builds white flash overlays from scaled sprites, handing them back to the Tk thread."""
+        while True:
+            job = self.__prescale_queue.get()
+            if job is None:
+                return
+            key, scaled_sprite = job
+            try:
+                flash = PokemonBattleWindow.__make_flash(scaled_sprite)
+                self._window.after(0, self.__store_flash, key, flash)
+            except (tk.TclError, RuntimeError):
+                return  # the window is gone
+            except:
+                print(traceback.format_exc())
+
+    def __store_flash(self, key: tuple[str, bool, tuple[int, int]], flash: Image.Image) -> None:
+        """Wrap a pre-scaled flash in a PhotoImage; this has to happen on the Tk thread."""
+        if key not in self.__flash_cache:
+            self.__flash_cache[key] = ImageTk.PhotoImage(flash)
+
+    @staticmethod
+    def __scale_sprite(pil_image: Image.Image, resize: tuple[int, int]) -> Image.Image:
+        """Return an RGBA copy of a sprite scaled to the given size."""
+        if pil_image.mode != "RGBA":
+            pil_image = pil_image.convert("RGBA")
+        return pil_image.resize(resize, Image.Resampling.NEAREST)
+
+    @staticmethod
+    def __make_flash(scaled_sprite: Image.Image) -> Image.Image:
+        """Return a white silhouette of a scaled sprite: white wherever it is opaque, transparent elsewhere."""
+        a = scaled_sprite.getchannel("A")
+        white = Image.new("L", scaled_sprite.size, 255)
+        return Image.merge("RGBA", (white, white, white, a))
+
     def __load_images(self):
         """Draw background, Pokemon, and HP bars initially."""
         # Use get_pil_image to manually resize background
-        pil_bg = self.__resource_manager.get_pil_image("fight_background").convert("RGB")
+        pil_bg = self.__resource_manager.get_pil_image("fight_background")
+        if pil_bg.mode != "RGB":
+            pil_bg = pil_bg.convert("RGB")
         pil_bg = pil_bg.resize((525, 270), Image.Resampling.NEAREST)
         bg_img = ImageTk.PhotoImage(pil_bg)
         self.__canvas.create_image(0, 0, image=bg_img, anchor=tk.NW)
-        self.__image_refs.append(bg_img)
+        self.__image_refs["bg"] = bg_img
 
         # Draw both Pokemon and their health bars
-        self.__draw_pokemon(self.__player_data["name"], back=True, position=(170, 190), resize=(160, 160))  # player
-        self.__draw_pokemon(self.__enemy_data["name"], back=False, position=(355, 120), resize=(130, 130))  # enemy
-        self.__draw_name_and_level(self.__player_data["name"], self.__player_data["level"], x=0, y=61)
-        self.__draw_name_and_level(self.__enemy_data["name"], self.__enemy_data["level"], x=525, y=171, align="right")
-        self.__draw_health_bar(-20, 70, self.__player_data["hp"], self.__player_data["max_hp"])
-        self.__draw_health_bar(335, 180, self.__enemy_data["hp"], self.__enemy_data["max_hp"])
-
-    def __draw_pokemon(self, pokemon_name: str, back: bool, position: tuple[int, int], resize: tuple[int, int]):
+        self.__draw_pokemon(self.__player_data["name"], back=True, position=(170, 190), resize=(160, 160), tag="p_sprite")  # player
+        self.__draw_pokemon(self.__enemy_data["name"], back=False, position=(355, 120), resize=(130, 130), tag="e_sprite")  # enemy
+        self.__draw_name_and_level(self.__player_data["name"], self.__player_data["level"], x=0, y=61, tag="p_name")
+        self.__draw_name_and_level(self.__enemy_data["name"], self.__enemy_data["level"], x=525, y=171, align="right", tag="e_name")
+        self.__draw_health_bar(-20, 70, self.__player_data["hp"], self.__player_data["max_hp"], tag="p_hp")
+        self.__draw_health_bar(335, 180, self.__enemy_data["hp"], self.__enemy_data["max_hp"], tag="e_hp")
+
+    def __draw_pokemon(self, pokemon_name: str, back: bool, position: tuple[int, int], resize: tuple[int, int], tag: str):
         """Draw a Pokemon sprite on the canvas with resizing support."""
-        sprite_type = "back" if back else "front"
-        key = f"Pokemon/{pokemon_name}_{sprite_type}"
+        tk_image = self.__sprite_cache.get((pokemon_name, back, resize))
+        if tk_image is None:
+            sprite_type = "back" if back else "front"
+            key = f"Pokemon/{pokemon_name}_{sprite_type}"
 
-        # Get raw PIL image, resize it, then convert to Tk image
-        pil_image = self.__resource_manager.get_pil_image(key).convert("RGBA")
-        pil_image = pil_image.resize(resize, Image.Resampling.NEAREST)
-        tk_image = ImageTk.PhotoImage(pil_image)
+            # Get raw PIL image, resize it, then convert to Tk image
+            pil_image = PokemonBattleWindow.__scale_sprite(self.__resource_manager.get_pil_image(key), resize)
+            tk_image = self.__sprite_cache[(pokemon_name, back, resize)] = ImageTk.PhotoImage(pil_image)
+            if (pokemon_name, back, resize) not in self.__flash_cache:
+                self.__prescale_queue.put(((pokemon_name, back, resize), pil_image))
 
-        self.__canvas.create_image(*position, image=tk_image, anchor=tk.CENTER, tags="sprites")
-        self.__image_refs.append(tk_image)
+        self.__place_image(tag, *position, tk_image, tk.CENTER)
 
-    def __draw_health_bar(self, x: int, y: int, hp: int, max_hp: int):
+    def __draw_health_bar(self, x: int, y: int, hp: int, max_hp: int, tag: str):
         """Draw Pokemon's health bar based on HP percentage."""
         percent = int((hp / max_hp) * 100)
         percent = max(0, min(100, percent))  # clamp to 0–100
         rounded = round(percent / 5) * 5  # round to nearest 5%
         if rounded == 0 and hp > 0:
             rounded = 1  # ensure min 1% is shown
+        if self.__hp_bar_shown.get(tag) == rounded:
+            return  # small hits often land in the same 5% bucket; the bar on screen is already right
+        self.__hp_bar_shown[tag] = rounded
 
-        key = f"HealthBars/{rounded}"
-        bar_image = self.__resource_manager.get_image(key)
-        self.__canvas.create_image(x, y, image=bar_image, anchor=tk.NW, tags="sprites")
-        self.__image_refs.append(bar_image)
+        bar_image = self.__hp_bar_images.get(rounded)
+        if bar_image is None:
+            bar_image = self.__hp_bar_images[rounded] = self.__resource_manager.get_image(f"HealthBars/{rounded}")
+        self.__place_image(tag, x, y, bar_image, tk.NW)
 
-    def __draw_name_and_level(self, name: str, level: int, x: int, y: int, align: str = "left"):
+    def __draw_name_and_level(self, name: str, level: int, x: int, y: int, tag: str, align: str = "left"):
         """Draw Pokemon's name and level above HP bar with alignment options ('left', 'center', 'right')."""
-        label = f" {name} Lv.{level} "
-        pil_image = self.__resource_manager.render_font(
-            self.__resource_manager.get_font("pkmn"),
-            label,
-            text_color=(255, 255, 255),  # white text
-            bg_color=(32, 32, 32)  # dark grey background
-        )
-
-        # Add rounded corners
-        radius = 10  # corner radius
-        mask = Image.new("L", pil_image.size, 0)
-        draw = ImageDraw.Draw(mask)
-        draw.rounded_rectangle([0, 0, pil_image.width, pil_image.height], radius=radius, fill=255)
-        rounded_image = pil_image.copy()
-        rounded_image.putalpha(mask)
-
-        if align == "right":
-            x -= pil_image.width
+        key = (name, level, align)
+        cached = self.__name_cache.get(key)
+        if cached is not None:
+            self.__name_cache.move_to_end(key)
+            tk_image, x_adjust = cached
+        else:
+            label = f" {name} Lv.{level} "
+            pil_image = self.__resource_manager.render_font(
+                self.__resource_manager.get_font("pkmn"),
+                label,
+                text_color=(255, 255, 255),  # white text
+                bg_color=(32, 32, 32)  # dark grey background
+            )
 
-        tk_image = ImageTk.PhotoImage(rounded_image)
-        self.__canvas.create_image(x, y, image=tk_image, anchor=tk.NW, tags="sprites")
-        self.__image_refs.append(tk_image)
+            # Add rounded corners
+            mask = self.__mask_cache.get(pil_image.size)
+            if mask is None:
+                radius = 10  # corner radius
+                mask = self.__mask_cache[pil_image.size] = Image.new("L", pil_image.size, 0)
+                draw = ImageDraw.Draw(mask)
+                draw.rounded_rectangle([0, 0, pil_image.width, pil_image.height], radius=radius, fill=255)
+            rounded_image = pil_image.copy()
+            rounded_image.putalpha(mask)
+
+            x_adjust = -pil_image.width if align == "right" else 0
+
+            tk_image = ImageTk.PhotoImage(rounded_image)
+            self.__name_cache[key] = (tk_image, x_adjust)
+            if len(self.__name_cache) > PokemonBattleWindow.NAME_CACHE_LIMIT:
+                self.__name_cache.popitem(last=False)
+
+        self.__place_image(tag, x + x_adjust, y, tk_image, tk.NW)
+
+    def __place_image(self, tag: str, x: int, y: int, image: ImageTk.PhotoImage, anchor: str):
+        """Show an image for a canvas role, reusing the role's existing item instead of recreating it."""
+        item = self.__items.get(tag)
+        if item is None:
+            self.__items[tag] = self.__canvas.create_image(x, y, image=image, anchor=anchor, tags=tag)
+        else:
+            self.__canvas.itemconfig(item, image=image)
+            self.__canvas.coords(item, x, y)
+        self.__image_refs[tag] = image
 
     def update_battle_state(self, player_data: dict, enemy_data: dict):
         """Update both Pokemon and their HP. Overlay a white sprite if damage taken."""
@@ -1887,20 +2287,31 @@ class PokemonBattleWindow(Window):
         player_switched = player_data["name"] != self.__prev_player_name
         enemy_switched = enemy_data["name"] != self.__prev_enemy_name
 
+        # Only redraw the elements whose data actually changed
+        name_p_changed = player_switched or player_data["level"] != self.__player_data["level"]
+        name_e_changed = enemy_switched or enemy_data["level"] != self.__enemy_data["level"]
+        hp_p_changed = (player_data["hp"], player_data["max_hp"]) != (self.__prev_player_hp, self.__player_data["max_hp"])
+        hp_e_changed = (enemy_data["hp"], enemy_data["max_hp"]) != (self.__prev_enemy_hp, self.__enemy_data["max_hp"])
+
         self.__prev_player_hp = player_data["hp"]
         self.__prev_enemy_hp = enemy_data["hp"]
 
         self.__player_data = player_data
         self.__enemy_data = enemy_data
 
-        self.__canvas.delete("sprites")
-
-        self.__draw_pokemon(player_data["name"], back=True, position=(170, 190), resize=(160, 160))
-        self.__draw_pokemon(enemy_data["name"], back=False, position=(355, 120), resize=(130, 130))
-        self.__draw_name_and_level(player_data["name"], player_data["level"], x=0, y=61)
-        self.__draw_name_and_level(enemy_data["name"], enemy_data["level"], x=525, y=171, align="right")
-        self.__draw_health_bar(-20, 70, player_data["hp"], player_data["max_hp"])
-        self.__draw_health_bar(335, 180, enemy_data["hp"], enemy_data["max_hp"])
+        # Existing items get their image swapped in place, so stacking order is unchanged
+        if player_switched:
+            self.__draw_pokemon(player_data["name"], back=True, position=(170, 190), resize=(160, 160), tag="p_sprite")
+        if enemy_switched:
+            self.__draw_pokemon(enemy_data["name"], back=False, position=(355, 120), resize=(130, 130), tag="e_sprite")
+        if name_p_changed:
+            self.__draw_name_and_level(player_data["name"], player_data["level"], x=0, y=61, tag="p_name")
+        if name_e_changed:
+            self.__draw_name_and_level(enemy_data["name"], enemy_data["level"], x=525, y=171, tag="e_name", align="right")
+        if hp_p_changed:
+            self.__draw_health_bar(-20, 70, player_data["hp"], player_data["max_hp"], tag="p_hp")
+        if hp_e_changed:
+            self.__draw_health_bar(335, 180, enemy_data["hp"], enemy_data["max_hp"], tag="e_hp")
 
         if player_took_damage and not player_switched:
             self._window.after(0, lambda: self.__draw_white_flash(player_data["name"], back=True, position=(170, 190), resize=(160, 160)))
@@ -1912,21 +2323,18 @@ class PokemonBattleWindow(Window):
 
     def __draw_white_flash(self, pokemon_name: str, back: bool, position: tuple[int, int], resize: tuple[int, int]):
         """Overlay a white sprite momentarily to indicate damage taken."""
-        sprite_type = "back" if back else "front"
-        key = f"Pokemon/{pokemon_name}_{sprite_type}"
+        tk_image = self.__flash_cache.get((pokemon_name, back, resize))
+        if tk_image is None:
+            sprite_type = "back" if back else "front"
+            key = f"Pokemon/{pokemon_name}_{sprite_type}"
 
-        # Use the new get_pil_image method
-        image = self.__resource_manager.get_pil_image(key).convert("RGBA")
-        image = image.resize(resize)
+            # Not pre-scaled yet, so build it here (same scaling as the sprite so the flash lines up)
+            image = PokemonBattleWindow.__scale_sprite(self.__resource_manager.get_pil_image(key), resize)
+            white_masked = PokemonBattleWindow.__make_flash(image)
 
-        r, g, b, a = image.split()
-        white_base = Image.new("RGBA", image.size, (255, 255, 255, 0))
-        white_overlay = Image.new("RGBA", image.size, (255, 255, 255, 255))
-        white_masked = Image.composite(white_overlay, white_base, a)
+            tk_image = self.__flash_cache[(pokemon_name, back, resize)] = ImageTk.PhotoImage(white_masked)
 
-        tk_image = ImageTk.PhotoImage(white_masked)
         sprite = self.__canvas.create_image(*position, image=tk_image, anchor=tk.CENTER)
-        self.__image_refs.append(tk_image)
 
         self._window.after(1000, lambda: self.__canvas.delete(sprite))
 
@@ -1935,8 +2343,9 @@ class PokemonBattleWindow(Window):
         return bool(self._window.winfo_exists())
 
     def run(self):
-        """Start the Tkinter main loop."""
-        self._window.mainloop()
+        """Show and raise the window."""
+        self._window.deiconify()
+        self._window.lift()
 
 
 class OptionsWindow(Window):
@@ -1954,7 +2363,10 @@ class OptionsWindow(Window):
         super().__init__(root_window, title="Options", width=525, height=150, offset_x=-540, offset_y=150)
 
         self.__option_labels = []
-        self.__image_refs = {} # so that the images don't get garbage collected
+        self.__label_variants: dict[tuple[str, bool], ImageTk.PhotoImage] = {} # (option, selected) -> rendered label
+        # (row, col) -> (unselected, selected) label images, also keeps them from being garbage collected
+        self.__label_images: dict[tuple[int, int], tuple[ImageTk.PhotoImage, ImageTk.PhotoImage]] = {}
+        self.__cursor_drawn_at = (0, 0) # cell currently showing the cursor prefix
         self.__build_options()
 
         # Bind the arrow and return keys
@@ -1977,9 +2389,13 @@ class OptionsWindow(Window):
                 grid.append([options[i]])
         return grid
 
-    def __get_prefix(self, row: int, col: int) -> str:
-        """Return prefix for label based on current cursor location in grid."""
-        return " > " if row == self.__selected_row and col == self.__selected_col else "  "
+    def __get_label_image(self, option: str, selected: bool) -> ImageTk.PhotoImage:
+        """Return the label image for an option with or without the cursor, rendering it on first use."""
+        tk_image = self.__label_variants.get((option, selected))
+        if tk_image is None:
+            prefix = " > " if selected else "  "
+            tk_image = self.__label_variants[(option, selected)] = self.__make_label_image(prefix + option + "  ")
+        return tk_image
 
     def __make_label_image(self, text: str) -> ImageTk.PhotoImage:
         """Create a label image with the given text."""
@@ -1989,15 +2405,17 @@ class OptionsWindow(Window):
 
     def __build_options(self):
         """Build the labels and set up the grid to make an options menu."""
+        # Render both cursor variants up front so moving the cursor only swaps images
+        self.__label_images = {}
         for row_index, row in enumerate(self.__options):
             label_row = []
             for col_index, option in enumerate(row):
-                prefix = self.__get_prefix(row_index, col_index)
-                tk_image = self.__make_label_image(prefix + option + "  ")
-                label = tk.Label(self._window, image=tk_image, anchor="w")
+                variants = (self.__get_label_image(option, False), self.__get_label_image(option, True))
+                self.__label_images[(row_index, col_index)] = variants
+                selected = row_index == self.__selected_row and col_index == self.__selected_col
+                label = tk.Label(self._window, image=variants[selected], anchor="w")
                 label.grid(row=row_index, column=col_index, padx=10, pady=5, sticky="w")
                 label_row.append(label)
-                self.__image_refs[(row_index, col_index)] = tk_image
             self.__option_labels.append(label_row)
 
         for col_index in range(max(len(row) for row in self.__options)):
@@ -2013,17 +2431,16 @@ class OptionsWindow(Window):
         self.__options = self.__to_grid(new_options)
         self.__selected_row = 0
         self.__selected_col = 0
+        self.__cursor_drawn_at = (0, 0)
         self.__build_options()
         
     def __update_cursor(self):
         """Show where the cursor is in the grid. (by updating the label images)"""
-        for row_index, row in enumerate(self.__options):
-            for col_index, option in enumerate(row):
-                prefix = self.__get_prefix(row_index, col_index)
-                tk_image = self.__make_label_image(prefix + option + "  ")
-                label = self.__option_labels[row_index][col_index]
-                label.config(image=tk_image)
-                self.__image_refs[(row_index, col_index)] = tk_image
+        # Only the cell the cursor left and the cell it moved to change
+        for row_index, col_index in (self.__cursor_drawn_at, (self.__selected_row, self.__selected_col)):
+            selected = row_index == self.__selected_row and col_index == self.__selected_col
+            self.__option_labels[row_index][col_index].config(image=self.__label_images[(row_index, col_index)][selected])
+        self.__cursor_drawn_at = (self.__selected_row, self.__selected_col)
 
     def __on_up(self, event):
         if self.__selected_row > 0:
@@ -2059,8 +2476,9 @@ class OptionsWindow(Window):
         return bool(self._window.winfo_exists())
 
     def run(self):
-        """Start the Tkinter main loop."""
-        self.__root_window.after(0, self._window.mainloop)
+        """Show and raise the window."""
+        self._window.deiconify()
+        self._window.lift()
         
 class ChooseObjectWindow(Window):
     """
@@ -2080,6 +2498,7 @@ class ChooseObjectWindow(Window):
         self.__orientation = orientation # portrait or landscape
         self.__selected_index = 0 # current selection index
         self.__image_refs = {}  # prevent images from being garbage collected
+        self.__label_images: list[tuple[ImageTk.PhotoImage, ImageTk.PhotoImage]] = []  # (unselected, selected) per option
         self.__sprite_size = sprite_size  # scale factor for images
         self.__gap = gap # spacing multipler between options
         self._label_height = label_height # y positioning of labels
@@ -2123,17 +2542,22 @@ class ChooseObjectWindow(Window):
             self.__canvas.create_image(x, y, image=tk_image, anchor=anchor)
             self.__image_refs[i] = tk_image
 
+    def __make_label_image(self, text: str) -> ImageTk.PhotoImage:
+        """Create a label image with the given text."""
+        label_image = self.__resource_manager.render_font(
+            self.__resource_manager.get_font('pkmn'), text)
+        return ImageTk.PhotoImage(label_image)
+
     def __draw_option_labels(self):
         """Render and place label text for each option."""
         labels = []
         for i, option_dict in enumerate(self.__options):
             label_text = list(option_dict.keys())[0]
-            prefix = " > " if i == self.__selected_index else "   "  # cursor prefix
-            
-            # Create label image with pkmn font
-            label_image = self.__resource_manager.render_font(
-                self.__resource_manager.get_font('pkmn'), prefix + label_text + "  ")
-            tk_image = ImageTk.PhotoImage(label_image)
+
+            # Create both cursor variants with pkmn font so selection changes only swap images
+            variants = (self.__make_label_image("   " + label_text + "  "), self.__make_label_image(" > " + label_text + "  "))
+            self.__label_images.append(variants)
+            tk_image = variants[i == self.__selected_index]
 
             if self.__orientation == "landscape":
                 x = 100 + i * self.__gap
@@ -2147,38 +2571,34 @@ class ChooseObjectWindow(Window):
                 anchor = tk.W
 
             label = self.__canvas.create_image(x, y, image=tk_image, anchor=anchor)
-            self.__image_refs[f"label_{i}"] = tk_image
             labels.append(label)
         return labels
 
-    def __update_labels(self):
+    def __update_labels(self, previous_index: int):
         """Update labels to reflect current cursor/selection."""
-        for i, option_dict in enumerate(self.__options):
-            label_text = list(option_dict.keys())[0]
-            prefix = " > " if i == self.__selected_index else "   " # cursor prefix
-            label_image = self.__resource_manager.render_font(
-                self.__resource_manager.get_font('pkmn'), prefix + label_text + "  ")
-            tk_image = ImageTk.PhotoImage(label_image)
-            self.__canvas.itemconfig(self.__option_labels[i], image=tk_image)
-            self.__image_refs[f"label_{i}"] = tk_image
+        # Only the option the cursor left and the one it moved to change
+        self.__canvas.itemconfig(self.__option_labels[previous_index], image=self.__label_images[previous_index][0])
+        self.__canvas.itemconfig(self.__option_labels[self.__selected_index], image=self.__label_images[self.__selected_index][1])
 
     def __on_left(self, event):
         """Move selection to the previous option."""
+        previous_index = self.__selected_index
         if self.__selected_index > 0:
             self.__selected_index -= 1
-            self.__update_labels()
+            self.__update_labels(previous_index)
         else: # reset to last if first option
             self.__selected_index = len(self.__option_labels) - 1
-            self.__update_labels()
+            self.__update_labels(previous_index)
 
     def __on_right(self, event):
         """Move selection to the next option."""
+        previous_index = self.__selected_index
         if self.__selected_index < len(self.__option_labels) - 1:
             self.__selected_index += 1
-            self.__update_labels()
+            self.__update_labels(previous_index)
         else: # reset to beginning if last option
             self.__selected_index = 0
-            self.__update_labels()
+            self.__update_labels(previous_index)
 
     def __on_return(self, event):
         """Send selected option to server and close window."""
@@ -2189,8 +2609,9 @@ class ChooseObjectWindow(Window):
         self._window.destroy()
 
     def run(self):
-        """Start the Tkinter main loop."""
-        self.__root_window.after(0, self._window.mainloop)
+        """Show and raise the window."""
+        self._window.deiconify()
+        self._window.lift()
         
 class DisplayStatsWindow(Window):
     """
@@ -2262,8 +2683,9 @@ class DisplayStatsWindow(Window):
         self._window.destroy()  # close the window
 
     def run(self):
-        """Start the Tkinter main loop."""
-        self.__root_window.after(0, self._window.mainloop)  
+        """Show and raise the window."""
+        self._window.deiconify()
+        self._window.lift()
         
 # ---------------------------------------------------------------------------------
 # Group 69 added these
@@ -2305,6 +2727,8 @@ class CombatUIWindow(Window):
         # Create panels
         self.__left_panel = self.__create_stat_panel(self.__left_frame, "PLAYER")
         self.__right_panel = self.__create_stat_panel(self.__right_frame, "OPPONENT")
+        for panel in (self.__left_panel, self.__right_panel):
+            panel['health_bar'].bind("<Configure>", lambda event, panel=panel: self.__on_health_bar_resize(panel, event))
         
         # Update panels with initial data
         if left_character:
@@ -2341,6 +2765,11 @@ class CombatUIWindow(Window):
         )
         health_bar.pack(fill=tk.X, padx=5, pady=(0, 10))
         
+        # Create the health bar items once; updates only move and recolor them
+        health_bg = health_bar.create_rectangle(0, 0, 0, 0, fill="#444444", outline="")
+        health_fg = health_bar.create_rectangle(0, 0, 0, 0, fill="#00CC00", outline="")
+        health_text = health_bar.create_text(0, 0, text="", fill="white", font=("Arial", 10, "bold"))
+        
         # Create attack section
         attack_frame = tk.Frame(panel_frame, bg="#383838")
         attack_frame.pack(fill=tk.X, padx=5, pady=2)
@@ -2404,6 +2833,11 @@ class CombatUIWindow(Window):
         return {
             'frame': panel_frame,
             'health_bar': health_bar,
+            'health_bg': health_bg,
+            'health_fg': health_fg,
+            'health_text': health_text,
+            'health_size': (health_bar.winfo_reqwidth(), health_bar.winfo_reqheight()),
+            'health_pct': 0,
             'attack_value': attack_value,
             'cooldown_value': cooldown_value,
             'name_label': name_label
@@ -2419,6 +2853,24 @@ class CombatUIWindow(Window):
             self.__right_character = right_character
             self.__update_panel(self.__right_panel, right_character)
     
+    def __on_health_bar_resize(self, panel: dict, event) -> None:
+        """Remember the health bar's size as Tk lays it out, and stretch the bar to fit."""
+        panel['health_size'] = (event.width, event.height)
+        self.__layout_health_bar(panel)
+
+    def __layout_health_bar(self, panel: dict) -> None:
+        """Size the health bar items from the stored canvas size, without asking Tk for the geometry."""
+        health_bar = panel['health_bar']
+        width, height = panel['health_size']
+        
+        # Resize background
+        health_bar.coords(panel['health_bg'], 0, 0, width, height)
+        
+        # Resize health bar
+        bar_width = int(width * panel['health_pct'])
+        health_bar.coords(panel['health_fg'], 0, 0, bar_width, height)
+        health_bar.coords(panel['health_text'], width // 2, height // 2)
+
     def __update_panel(self, panel: dict, stats: dict) -> None:
         """Update a panel with character stats"""
         if not panel:
@@ -2433,19 +2885,10 @@ class CombatUIWindow(Window):
             hp = stats['hp']
             max_hp = stats['max_hp']
             health_pct = hp / max_hp if max_hp > 0 else 0
+            panel['health_pct'] = health_pct
             
-            # Clear existing health bar
             health_bar = panel['health_bar']
-            health_bar.delete("all")
-            
-            # Draw background
-            health_bar.create_rectangle(
-                0, 0, health_bar.winfo_width(), health_bar.winfo_height(),
-                fill="#444444", outline=""
-            )
-            
-            # Draw health bar
-            bar_width = int(health_bar.winfo_width() * health_pct)
+            self.__layout_health_bar(panel)
             
             # Choose color based on health percentage
             if health_pct > 0.5:
@@ -2455,19 +2898,10 @@ class CombatUIWindow(Window):
             else:
                 color = "#FF3333"  # Red
             
-            health_bar.create_rectangle(
-                0, 0, bar_width, health_bar.winfo_height(),
-                fill=color, outline=""
-            )
+            health_bar.itemconfig(panel['health_fg'], fill=color)
             
-            # Draw health text
-            health_bar.create_text(
-                health_bar.winfo_width() // 2,
-                health_bar.winfo_height() // 2,
-                text=f"{hp}/{max_hp}",
-                fill="white",
-                font=("Arial", 10, "bold")
-            )
+            # Update health text
+            health_bar.itemconfig(panel['health_text'], text=f"{hp}/{max_hp}")
         
         # Update attack value
         if 'attack' in stats:
@@ -2485,8 +2919,9 @@ class CombatUIWindow(Window):
                 panel['cooldown_value'].config(text=f"{cooldown}s", fg="#FF6600")
     
     def run(self):
-        """Run the window main loop"""
-        self._window.mainloop()
+        """Show and raise the window."""
+        self._window.deiconify()
+        self._window.lift()
 
 
 class TimerWindow(Window):
@@ -2506,6 +2941,7 @@ class TimerWindow(Window):
         self.__network_manager = network_manager
         self.__time_str = time_str
         self.__is_match_over = is_match_over
+        self.__update_pending = False
         
         # Create main frame with dark background
         self.__main_frame = tk.Frame(self._window, bg="#2E2E2E")
@@ -2522,12 +2958,22 @@ class TimerWindow(Window):
         self.__timer_label.pack(pady=5)
         
         # Update timer display
-        self.update_timer(time_str, is_match_over)
+        self.__apply_timer()
     
     def update_timer(self, time_str: str, is_match_over: bool) -> None:
         """Update the timer display"""
+        # Only the newest time matters, so a burst of updates is drawn once when Tk goes idle
         self.__time_str = time_str
         self.__is_match_over = is_match_over
+        if not self.__update_pending:
+            self.__update_pending = True
+            self._window.after_idle(self.__apply_timer)
+    
+    def __apply_timer(self) -> None:
+        """Draw the most recent timer state."""
+        self.__update_pending = False
+        time_str = self.__time_str
+        is_match_over = self.__is_match_over
         
         # Update timer text
         self.__timer_label.config(text=time_str)
@@ -2552,8 +2998,9 @@ class TimerWindow(Window):
             self.__timer_label.config(fg="#FF0000", text="TIME'S UP!")
     
     def run(self):
-        """Run the window main loop"""
-        self._window.mainloop()
+        """Show and raise the window."""
+        self._window.deiconify()
+        self._window.lift()
 
 
 class CombatResultWindow(Window):
@@ -2562,29 +3009,44 @@ class CombatResultWindow(Window):
     
     This window appears after a combat match concludes.
     """
+    # Colors and text for each result; anything other than a win uses the losing style
+    RESULT_STYLES = {
+        "win": {
+            "title": "Combat Victory",
+            "header_color": "#FFD700",
+            "header_text": "VICTORY!",
+            "hp_color": "#00FF00",
+            "bg_accent": "#2E2E2E",
+            "fighter_prefix": "Victor",
+            "message": "Congratulations on your victory!",
+        },
+        "lose": {
+            "title": "Combat Defeat",
+            "header_color": "#FF5555",
+            "header_text": "DEFEAT!",
+            "hp_color": "#FF9900",
+            "bg_accent": "#3A2E2E",
+            "fighter_prefix": "Fighter",
+            "message": "Better luck next time...",
+        },
+    }
     
     def __init__(self, root_window: tk.Tk, network_manager: NetworkManager, 
                  fighter_data: dict, result_type: str = "win") -> None:
-        # Set window title based on result
-        title = "Victory" if result_type == "win" else "Defeat"
-        super().__init__(root_window, title=f"Combat {title}", width=400, height=350, offset_x=0, offset_y=0)
+        style = CombatResultWindow.RESULT_STYLES["win" if result_type == "win" else "lose"]
+        super().__init__(root_window, title=style["title"], width=400, height=350, offset_x=0, offset_y=0)
         
         self.__root_window = root_window
         self.__network_manager = network_manager
         self.__fighter_data = fighter_data
         self.__result_type = result_type
+        self.__style = style
         
         # Configure colors based on result
-        if result_type == "win":
-            self.__header_color = "#FFD700"
-            self.__header_text = "VICTORY!"
-            self.__hp_color = "#00FF00"
-            self.__bg_accent = "#2E2E2E"
-        else: # losing colors
-            self.__header_color = "#FF5555"
-            self.__header_text = "DEFEAT!"
-            self.__hp_color = "#FF9900"
-            self.__bg_accent = "#3A2E2E"
+        self.__header_color = style["header_color"]
+        self.__header_text = style["header_text"]
+        self.__hp_color = style["hp_color"]
+        self.__bg_accent = style["bg_accent"]
         
         # Set window properties
         self._window.configure(bg="#1E1E1E")
@@ -2635,13 +3097,10 @@ class CombatResultWindow(Window):
         fighter_hp = self.__fighter_data.get("hp", 0)
         fighter_max_hp = self.__fighter_data.get("max_hp", 100)
         
-        # Fighter label text depends on result
-        fighter_prefix = "Victor" if self.__result_type == "win" else "Fighter"
-        
         # Fighter name
         name_label = tk.Label(
             info_frame,
-            text=f"{fighter_prefix}: {fighter_name}",
+            text=f"{self.__style['fighter_prefix']}: {fighter_name}",
             font=("Arial", 16, "bold"),
             fg="white",
             bg=self.__bg_accent
@@ -2659,14 +3118,9 @@ class CombatResultWindow(Window):
         health_label.pack(pady=10)
         
         # Add result-specific message
-        if self.__result_type == "win":
-            message = "Congratulations on your victory!"
-        else:
-            message = "Better luck next time..."
-            
         message_label = tk.Label(
             info_frame,
-            text=message,
+            text=self.__style["message"],
             font=("Arial", 12, "italic"),
             fg="#CCCCCC",
             bg=self.__bg_accent
@@ -2710,12 +3164,16 @@ class CombatResultWindow(Window):
         self._window.destroy()
     
     def run(self):
-        """Run the window main loop"""
-        self._window.mainloop()
+        """Show and raise the window."""
+        self._window.deiconify()
+        self._window.lift()
 # ---------------------------------------------------------------------------------
 
 class MagicalKeyWindow(Window):
     """Window that shows a potion being poured over a key to make it magical"""
+    ROTATION_STEP = 15
+    # image path -> the potion rendered at every pouring angle (0, 15, ..., 180), shared by every window
+    _rotation_frames: dict[str, list[ImageTk.PhotoImage]] = {}
     
     def __init__(self, root_window: tk.Tk, network_manager, resource_manager) -> None:
         super().__init__(root_window, title="Magical Key Transformation", 
@@ -2746,6 +3204,8 @@ class MagicalKeyWindow(Window):
         self.__potion_angle = 0
         self.__potion_id = 0
         self.__rotating = False
+        # Load every potion up front so switching potions mid-animation never touches the disk
+        self.__potion_frames = {name: self.__get_rotation_frames(path) for name, path in self.__potion_images.items()}
         self.__load_current_potion()
 
         self.__canvas = tk.Canvas(self._window, width=400, height=300, bg="#424242")
@@ -2760,35 +3220,52 @@ class MagicalKeyWindow(Window):
     def __load_current_potion(self):
         """Load the current potion image based on the current index"""
         current_potion = self.__potion_types[self.__current_potion_index]
-        image_path = self.__potion_images[current_potion]
-        self.__potion_image = Image.open(get_resource_path(image_path)).resize((40, 40), Image.Resampling.NEAREST)
+        self.__rotation_frames = self.__potion_frames[current_potion]
+
+    def __get_rotation_frames(self, image_path: str) -> list[ImageTk.PhotoImage]:
+        """Return the potion image at every pouring angle, loading and rotating it the first time it is used."""
+        frames = MagicalKeyWindow._rotation_frames.get(image_path)
+        if frames is None:
+            # Rotate once per potion image rather than on every animation tick
+            potion_image = Image.open(get_resource_path(image_path)).resize((40, 40), Image.Resampling.NEAREST)
+            frames = MagicalKeyWindow._rotation_frames[image_path] = [
+                ImageTk.PhotoImage(potion_image.rotate(angle, expand=True))
+                for angle in range(0, 181, MagicalKeyWindow.ROTATION_STEP)
+            ]
+        return frames
 
     def __draw_initial_scene(self):
         """Draw the initial scene with key and potion"""
         self.__canvas.create_text(200, 30, text="Press SPACE to pour the potions!", 
-                                  fill="white", font=("Arial", 14))
+                                  fill="white", font=("Arial", 14), tags="initial")
         
         # Draw key image
         try:
             key_img = Image.open(get_resource_path("image/tile/utility/boringKey.png"))
             key_img = key_img.resize((20, 55), Image.Resampling.NEAREST).rotate(-45, expand=True)
             key_photo = ImageTk.PhotoImage(key_img)
-            self.__canvas.create_image(200, 200, image=key_photo)
+            self.__canvas.create_image(200, 200, image=key_photo, tags="initial")
             self.__image_refs.append(key_photo)
         except Exception as e:
-            self.__canvas.create_rectangle(150, 150, 250, 190, fill="yellow", outline="gold")
-            self.__canvas.create_text(200, 170, text="KEY", fill="black")
+            self.__canvas.create_rectangle(150, 150, 250, 190, fill="yellow", outline="gold", tags="initial")
+            self.__canvas.create_text(200, 170, text="KEY", fill="black", tags="initial")
         
         # Draw potion image, colored based on potion type
         try:
-            potion_photo = ImageTk.PhotoImage(self.__potion_image)
-            self.__potion_id = self.__canvas.create_image(200, 85, image=potion_photo)
-            self.__image_refs.append(potion_photo)
+            potion_photo = self.__rotation_frames[0]
+            self.__potion_id = self.__canvas.create_image(200, 85, image=potion_photo, tags="initial")
         except Exception as e:
             current_potion = self.__potion_types[self.__current_potion_index]
             potion_color = self.__potion_colors.get(current_potion, "#fbc832")
-            self.__canvas.create_rectangle(180, 70, 220, 120, fill=potion_color, outline="black")
-            self.__canvas.create_rectangle(195, 50, 205, 70, fill="brown", outline="black")
+            self.__canvas.create_rectangle(180, 70, 220, 120, fill=potion_color, outline="black", tags="initial")
+            self.__canvas.create_rectangle(195, 50, 205, 70, fill="brown", outline="black", tags="initial")
+        
+        # Potion stream, reshaped on each pouring step and hidden between potions
+        self.__pour_rect = self.__canvas.create_rectangle(198, 110, 202, 110, fill="", outline="black",
+                                                          state="hidden", tags=("initial", "pouring"))
+        
+        # The end scene is built now as well, so the transformation only has to swap which scene is visible
+        self.__draw_transformed_scene()
         
         
     def __pour_potion(self, event):
@@ -2800,12 +3277,10 @@ class MagicalKeyWindow(Window):
     def __rotate_potion(self):
         """Rotate the potion bottle gradually"""
         if self.__potion_angle < 184:
-            rotated_img = self.__potion_image.rotate(self.__potion_angle, expand=True)
-            rotated_photo = ImageTk.PhotoImage(rotated_img)
+            rotated_photo = self.__rotation_frames[self.__potion_angle // MagicalKeyWindow.ROTATION_STEP]
             
             self.__canvas.itemconfig(self.__potion_id, image=rotated_photo)
-            self.__image_refs.append(rotated_photo)
-            self.__potion_angle += 15
+            self.__potion_angle += MagicalKeyWindow.ROTATION_STEP
             
             self._window.after(50, self.__rotate_potion)
         else:
@@ -2815,19 +3290,13 @@ class MagicalKeyWindow(Window):
     def __animate_pouring(self):
         """Animate the potion being poured"""
         if self.__animation_step < 10:
-            self.__canvas.delete("pouring")
-            
-            current_potion = self.__potion_types[self.__current_potion_index]
-            potion_color = self.__potion_colors.get(current_potion, "#fbc832")
+            if self.__animation_step == 0:
+                current_potion = self.__potion_types[self.__current_potion_index]
+                potion_color = self.__potion_colors.get(current_potion, "#fbc832")
+                self.__canvas.itemconfig(self.__pour_rect, fill=potion_color, state="normal")
 
             y_offset = self.__animation_step * 10
-            self.__canvas.create_rectangle(
-                198, 110 + y_offset, 
-                202, 110, 
-                fill=potion_color, 
-                outline="black", 
-                tags="pouring"
-            )
+            self.__canvas.coords(self.__pour_rect, 198, 110 + y_offset, 202, 110)
             
             self.__animation_step += 1
             self._window.after(100, self.__animate_pouring)
@@ -2849,12 +3318,11 @@ class MagicalKeyWindow(Window):
 
     def __draw_next_potion(self):
         """Draw the next potion after the previous one finished pouring"""
-        self.__canvas.delete("pouring")
+        self.__canvas.itemconfig(self.__pour_rect, state="hidden")
         
         try:
-            potion_photo = ImageTk.PhotoImage(self.__potion_image)
+            potion_photo = self.__rotation_frames[0]
             self.__canvas.itemconfig(self.__potion_id, image=potion_photo)
-            self.__image_refs.append(potion_photo)
         except Exception as e:
             pass
         
@@ -2873,27 +3341,30 @@ class MagicalKeyWindow(Window):
         
         flash_on()
         
-    def __show_transformed_key(self):
-        """Show the transformed magical key"""
-        self.__canvas.delete("all")
-        
+    def __draw_transformed_scene(self):
+        """Draw the hidden scene with the magical key, shown once every potion has been poured"""
         self.__canvas.create_text(200, 30, text="Key transformed with all Magical Potions!", 
-                                  fill="white", font=("Arial", 14))
+                                  fill="white", font=("Arial", 14), state="hidden", tags="transformed")
         self.__canvas.create_text(200, 60, text="You can now unlock the Chest!", 
-                                  fill="white", font=("Arial", 14))
+                                  fill="white", font=("Arial", 14), state="hidden", tags="transformed")
         self.__canvas.create_text(200, 250, text="Press ENTER to continue", 
-                                  fill="white", font=("Arial", 12))
+                                  fill="white", font=("Arial", 12), state="hidden", tags="transformed")
         
         try:
             key_img = Image.open(get_resource_path("image/tile/utility/magicalKey.png"))
             key_img = key_img.resize((20, 55), Image.Resampling.NEAREST).rotate(-45, expand=True)
             key_photo = ImageTk.PhotoImage(key_img)
-            self.__canvas.create_image(200, 140, image=key_photo)
+            self.__canvas.create_image(200, 140, image=key_photo, state="hidden", tags="transformed")
             self.__image_refs.append(key_photo)
         except Exception as e:
-            self.__canvas.create_oval(140, 140, 260, 200, fill="#fbc832", outline="")
-            self.__canvas.create_rectangle(150, 150, 250, 190, fill="gold", outline="white")
-            self.__canvas.create_text(200, 170, text="MAGICAL KEY", fill="black")
+            self.__canvas.create_oval(140, 140, 260, 200, fill="#fbc832", outline="", state="hidden", tags="transformed")
+            self.__canvas.create_rectangle(150, 150, 250, 190, fill="gold", outline="white", state="hidden", tags="transformed")
+            self.__canvas.create_text(200, 170, text="MAGICAL KEY", fill="black", state="hidden", tags="transformed")
+        
+    def __show_transformed_key(self):
+        """Show the transformed magical key"""
+        self.__canvas.itemconfigure("initial", state="hidden")
+        self.__canvas.itemconfigure("transformed", state="normal")
         
         self.__animation_complete = True
         
@@ -2906,8 +3377,9 @@ class MagicalKeyWindow(Window):
             self._window.destroy()
     
     def run(self):
-        """Start the window's main loop"""
-        self.__root_window.after(0, self._window.mainloop)
+        """Show and raise the window."""
+        self._window.deiconify()
+        self._window.lift()
 
 
 if __name__ == '__main__':
@@ -1,11 +1,29 @@
+from functools import lru_cache
+
 
 class Coord:
-    """ A class to represent a coordinate. """
+    """ A class to represent an immutable coordinate. Arithmetic always returns a new coordinate,
+        so a Coord can be shared freely without being copied.
+    """
+
+    __slots__ = ('y', 'x')
 
     def __init__(self, y: int, x: int) -> None:
         """ Initializes the coordinate with the given y and x values. """
-        self.y: int = y
-        self.x: int = x
+        object.__setattr__(self, 'y', y)
+        object.__setattr__(self, 'x', x)
+
+    def __setattr__(self, name: str, value) -> None:
+        """ Coordinates cannot be modified after they are created. """
+        raise AttributeError(f"Coord is immutable; cannot set '{name}'.")
+
+    def __delattr__(self, name: str) -> None:
+        """ Coordinates cannot be modified after they are created. """
+        raise AttributeError(f"Coord is immutable; cannot delete '{name}'.")
+
+    def __reduce__(self) -> tuple:
+        """ Supports pickling and copying of the coordinate. """
+        return (Coord, (self.y, self.x))
     
     @classmethod
     def from_Coord(cls, coord) -> 'Coord':
@@ -15,12 +33,6 @@ class Coord:
     def __add__(self, other) -> "Coord":
         """ Adds the current coordinate with the given one and returns a new coordinate. """
         return Coord(self.y + other.y, self.x + other.x)
-    
-    def __iadd__(self, other) -> "Coord":
-        """ Adds the current coordinate with the given one and returns the current coordinate. """
-        self.y += other.y
-        self.x += other.x
-        return self
 
     def __mul__(self, other) -> "Coord":
         """ Multiplies the current coordinate with the given number and returns a new coordinate. """
@@ -59,6 +71,14 @@ MOVE_TO_DIRECTION: dict[str, Coord] = {
     'down': Coord(1, 0),
 }
 
+@lru_cache(maxsize=None)
+def get_ray_offsets(direction_s: str, length: int) -> tuple[tuple[int, int], ...]:
+    """ Returns the (y, x) offsets of the first `length` cells in the given direction, nearest first.
+        The result is cached, so objects looking the same way share one tuple.
+    """
+    dy, dx = MOVE_TO_DIRECTION[direction_s].to_tuple()
+    return tuple((dy * k, dx * k) for k in range(1, length + 1))
+
 class Rect:
     """ A class to represent a rectangle. """
     def __init__(self, top_left: Coord, bottom_right: Coord) -> None:
@@ -1,11 +1,15 @@
 
 import json
+import threading
 from typing import TypeVar
 from abc import ABC, abstractmethod
 
 from .database import db
 
 class DatabaseEntity(ABC):
+    # Deferred state is written from the receive thread and flushed from the server loop
+    _state_lock = threading.Lock()
+
     @abstractmethod
     def get_name(self) -> str:
         """ Returns the name of the entity. """
@@ -14,6 +18,10 @@ class DatabaseEntity(ABC):
     T = TypeVar('T')
     def get_state(self, key: str, default: T = 0) -> T:
         """ Get the state for the given key. """
+        with DatabaseEntity._state_lock:
+            pending_state = getattr(self, '_pending_state', None)
+            if pending_state and key in pending_state:
+                return pending_state[key]
         state = db.get_state(self)
         if key in state:
             return state[key]
@@ -26,6 +34,36 @@ class DatabaseEntity(ABC):
             json.dumps(value)
         except (TypeError, OverflowError):
             raise ValueError(f"Value for key '{key}' is not JSON serializable.")
-        state = db.get_state(self)
-        state[key] = value
-        db.update_state(self, state) # update database
\ No newline at end of file
+        with DatabaseEntity._state_lock:
+            pending_state = getattr(self, '_pending_state', None)
+            if pending_state:
+                pending_state.pop(key, None)
+            state = db.get_state(self)
+            state[key] = value
+            db.update_state(self, state) # update database
+
+    def defer_state(self, key: str, value: T) -> None:
+        """ Set the state for the given key without writing to the database yet.
+            The value is returned by get_state right away and written by the next flush_state().
+        """
+        with DatabaseEntity._state_lock:
+            if getattr(self, '_pending_state', None) is None:
+                self._pending_state: dict = {}
+            self._pending_state[key] = value
+
+    def flush_state(self) -> None:
+        """ Write all deferred state to the database in a single update. """
+        with DatabaseEntity._state_lock:
+            pending_state = getattr(self, '_pending_state', None)
+            if not pending_state:
+                return
+            # check if values are JSON serializable
+            for key, value in pending_state.items():
+                try:
+                    json.dumps(value)
+                except (TypeError, OverflowError):
+                    raise ValueError(f"Value for key '{key}' is not JSON serializable.")
+            state = db.get_state(self)
+            state.update(pending_state)
+            db.update_state(self, state) # update database
+            self._pending_state = {}
\ No newline at end of file
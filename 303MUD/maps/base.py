@@ -327,9 +327,13 @@ class Map(RecipientInterface, DatabaseEntity, KeybindInterface):
     def send_grid_to_players(self) -> list[Message]:
         """ Return a list of grid messages to send to the players in the map. """
         messages = []
+        room_info = None
         for player in self.__clients:
             if type(player) == HumanPlayer:
-                messages.append(GridMessage(player, send_desc=False))
+                if room_info is None:
+                    # the grid is the same for everyone in the room, so build it only once
+                    room_info = self.get_info(player)
+                messages.append(GridMessage(player, send_desc=False, room_info=room_info))
         return messages
 
     def send_message_to_players(self, message: str) -> list[Message]:
@@ -370,29 +374,85 @@ class Map(RecipientInterface, DatabaseEntity, KeybindInterface):
             messages.extend(object.update())
         return messages
 
+    def flush_state(self) -> None:
+        """ Write the deferred state of the map and of every NPC in it to the database. """
+        super().flush_state()
+        for npc in self.__npcs:
+            npc.flush_state()
+
+    def is_blocked(self, player: "Player", position: Coord) -> bool:
+        """ Returns True if the player cannot stand at the given position, either because
+            it is out of bounds or because something there is not passable.
+        """
+        if not (0 <= position.y + (player.num_rows - 1) < self._map_rows and 0 <= position.x + (player.num_cols - 1) < self._map_cols):
+            return True
+        for tile in self.__get_tile_cell(position):
+            if not tile.is_passable():
+                return True
+        return False
+
     def move(self, player: "Player", direction_s: str) -> list[Message]:
         """ Move the player in the given direction. """
 
         new_position: Coord = player.get_current_position() + MOVE_TO_DIRECTION[direction_s]
-        if not (0 <= new_position.y + (player.num_rows - 1) < self._map_rows and 0 <= new_position.x + (player.num_cols - 1) < self._map_cols):
+        if self.is_blocked(player, new_position):
             return []
         
-        return self.move_to(player, new_position)
+        return self.__move_to_unchecked(player, new_position)
+
+    def move_n(self, player: "Player", direction_s: str, steps: int) -> list[Message]:
+        """ Move the player up to the given number of steps in the given direction, stopping before
+            the first cell that is out of bounds or not passable. The whole run is applied as a single
+            move, so the players in the map only receive one grid update.
+
+            Rooms that override move still see every step: the walk is made one self.move at a time,
+            so their gates and observers run on each intermediate tile. It stops as soon as a step
+            leaves the player where they were.
+        """
+
+        if type(self).move is not Map.move:
+            messages: list[Message] = []
+            for _ in range(steps):
+                position = player.get_current_position()
+                messages.extend(self.move(player, direction_s))
+                if player.get_current_position() == position:
+                    break
+            return messages
+
+        direction: Coord = MOVE_TO_DIRECTION[direction_s]
+        new_position: Coord = player.get_current_position()
+        for _ in range(steps):
+            next_position = new_position + direction
+            if self.is_blocked(player, next_position):
+                break
+            new_position = next_position
+
+        if new_position == player.get_current_position():
+            return []
+        return self.__move_to_unchecked(player, new_position)
     
     def move_to(self, player: "Player", new_position: Coord) -> list[Message]:
         """ Move the player to the given position. """
 
-        exit_messages = []
-        cur_cell = self.__get_tile_cell(player.get_current_position())
-        for tile in cur_cell:
-            exit_messages.extend(tile.player_exited(player))
-
         new_cell = self.__get_tile_cell(new_position)
         #print("Moving to", new_position, "which contains:")
         for tile in new_cell:
             if not tile.is_passable():
                 return []
 
+        return self.__move_to_unchecked(player, new_position)
+
+    def __move_to_unchecked(self, player: "Player", new_position: Coord) -> list[Message]:
+        """ Move the player to the given position without checking that it is passable.
+            Callers must have already checked the destination, e.g. with is_blocked.
+        """
+
+        new_cell = self.__get_tile_cell(new_position)
+        exit_messages = []
+        cur_cell = self.__get_tile_cell(player.get_current_position())
+        for tile in cur_cell:
+            exit_messages.extend(tile.player_exited(player))
+
         status, err = self.remove_from_grid(player, player.get_current_position())
         if not status and type(player) == HumanPlayer:
             return [ServerMessage(player, err)]
@@ -9,9 +9,9 @@ def fill_area(objects: list[tuple[MapObject, Coord]], object_fill, start: Coord,
     """
     # handle cases of filling as a line of tiles
     if start.x == end.x:  # vertical line
-        end.x+=1
+        end = Coord(end.y, end.x + 1)
     elif start.y == end.y:  # horizontal line
-        end.y+=1
+        end = Coord(end.y + 1, end.x)
 
     for x in range(start.y, end.y):
         for y in range(start.x, end.x):
@@ -47,13 +47,17 @@ class Message(ABC):
 
     def prepare(self) -> str:
         """ Returns a JSON string representation of the message. """
-        return json.dumps({
+        return json.dumps(self._prepare_dict())
+
+    def _prepare_dict(self) -> dict:
+        """ Returns the dictionary that is serialized by prepare(). """
+        return {
             'classname': self.__class__.__name__,
             'handle': self.__sender.get_name(),
             'time': time.time(),
             'seq_num': self.__recipient.get_and_increment_seq_num() if hasattr(self.__recipient, 'get_and_increment_seq_num') else 0,
             **self._get_data(),
-        })
+        }
 
     @abstractmethod
     def _get_data(self) -> dict:
@@ -144,15 +148,40 @@ class ServerMessage(Message, SenderInterface):
     
 class GridMessage(Message, SenderInterface):
     """ A message to update the grid of a recipient. """
-    def __init__(self, recipient: "HumanPlayer", send_desc : bool = True) -> None:
-        """ Initializes the grid message with the recipient. """
+    def __init__(self, recipient: "HumanPlayer", send_desc : bool = True, room_info: dict | None = None) -> None:
+        """ Initializes the grid message with the recipient.
+            room_info may be passed in when the same room snapshot is sent to several players.
+        """
         self.__send_desc: bool = send_desc
         self.__position: tuple[int, int] = recipient.get_current_position().to_tuple()
-        self.__room_info: dict = recipient.get_current_room().get_info(recipient)
+        if room_info is None:
+            room_info = recipient.get_current_room().get_info(recipient)
+        self.__room_info: dict = room_info
         Message.__init__(self, self, recipient)
 
     def get_name(self) -> Literal['***SERVER***']:
         return "***SERVER***"
+
+    def sends_description(self) -> bool:
+        """ Returns True if the client should also display the room description. """
+        return self.__send_desc
+
+    @staticmethod
+    def coalesce(messages: list[Message]) -> list[Message]:
+        """ Returns the messages without the grid updates that are superseded by a later grid update
+            to the same recipient. The client redraws the whole grid on every update, so only the newest
+            frame is visible anyway. Grid updates that carry the room description are always kept.
+        """
+        latest_grid: dict[int, Message] = {}
+        for message in messages:
+            if isinstance(message, GridMessage):
+                latest_grid[id(message.get_recipient())] = message
+        if len(latest_grid) == sum(isinstance(message, GridMessage) for message in messages):
+            return messages
+        return [message for message in messages
+                if not isinstance(message, GridMessage)
+                or message.sends_description()
+                or latest_grid[id(message.get_recipient())] is message]
     
     def _get_data(self) -> dict:
          data = dict(self.__room_info)
@@ -197,6 +226,33 @@ class MenuMessage(Message):
             'menu_options': self.__menu_options,
         }
 
+class CompositeMessage(Message, SenderInterface):
+    """ A bundle of messages for a single recipient, sent to the client as one frame. """
+    def __init__(self, recipient: RecipientInterface, messages: list[Message]) -> None:
+        """ Initializes the composite message with the recipient and the messages to bundle. """
+        assert all(message.get_recipient() is recipient for message in messages), "All bundled messages must share the recipient."
+        self.__messages: list[Message] = messages
+        Message.__init__(self, self, recipient)
+
+    @staticmethod
+    def bundle(recipient: RecipientInterface, messages: list[Message]) -> list[Message]:
+        """ Returns the given messages with those addressed to the recipient merged into one composite message.
+            Messages for other recipients are returned unchanged, in their original order.
+        """
+        own_messages = [message for message in messages if message.get_recipient() is recipient]
+        if len(own_messages) <= 1:
+            return messages
+        other_messages = [message for message in messages if message.get_recipient() is not recipient]
+        return other_messages + [CompositeMessage(recipient, own_messages)]
+
+    def get_name(self) -> Literal['***SERVER***']:
+        return "***SERVER***"
+
+    def _get_data(self) -> dict:
+        return {
+            'messages': [message._prepare_dict() for message in self.__messages],
+        }
+
 '''
 class FileMessage(Message):
     """ A message to download a file for a recipient. """
@@ -5,6 +5,7 @@
 import os
 import re
 import time
+import atexit
 import traceback
 import threading
 from queue import Queue
@@ -94,6 +95,7 @@ class ChatBackend(object):
     def __send_messages_to_recipients(self, messages: list[Message]):
         for x in messages:
             assert isinstance(x, Message), x
+        messages = GridMessage.coalesce(messages)
         for message in messages:
             recipient = message.get_recipient()
             if isinstance(recipient, Map):
@@ -126,7 +128,9 @@ class ChatBackend(object):
         messages: list[Message] = []
 
         try:
-            if 'move' in data_d:
+            if data_d.get('type') == 'disconnect':
+                self.__flush_state()
+            elif 'move' in data_d:
                 key = data_d['move'].lower()
                 current_map_objects = player.get_current_map_object()
                 for obj in current_map_objects:
@@ -176,11 +180,21 @@ class ChatBackend(object):
                     continue
                 messages = room.update()
                 self.__send_messages_to_recipients(messages)
+            self.__flush_state()
 
             time.sleep(1)
 
+    def __flush_state(self):
+        """ Write deferred state for every room and NPC, including rooms nobody is in anymore. """
+        for room in self.__rooms.values():
+            try:
+                room.flush_state()
+            except:
+                print(traceback.format_exc())
+
     def start(self) -> tuple[Queue, Queue]:
         """ Start the backend thread with a single player. Should only be called once."""
+        atexit.register(self.__flush_state) # don't lose deferred state when the client shuts down
         self.__rcv_t.start()
         self.__event_t.start()
         return self.__message_inbox, self.__message_outbox
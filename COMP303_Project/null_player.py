@@ -47,7 +47,7 @@ class NullPlayer(HumanPlayer):
         Returns:
             Coord: The position as a Coord object.
         """
-        return Coord.from_Coord(self._current_position)
+        return self._current_position
 
     def get_current_room(self) -> 'Map':
         """
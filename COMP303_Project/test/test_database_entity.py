@@ -0,0 +1,62 @@
+import pytest
+import sys
+from typing import TYPE_CHECKING
+
+from ..imports import *
+
+if TYPE_CHECKING:
+    from Player import HumanPlayer
+
+
+class TestDatabaseEntity:
+    @pytest.fixture
+    def stored_states(self, monkeypatch):
+        """Fixture to replace the database with an in-memory dict, so tests don't touch the pickle files."""
+        states = {}
+        db = sys.modules["303MUD.database_entity"].db
+
+        def mock_get_state(obj):
+            return dict(states.get(obj.get_name(), {}))
+
+        def mock_update_state(obj, state):
+            states[obj.get_name()] = dict(state)
+
+        monkeypatch.setattr(db, "get_state", mock_get_state)
+        monkeypatch.setattr(db, "update_state", mock_update_state)
+        return states
+
+    @pytest.fixture
+    def player(self):
+        """Fixture to create a player for testing."""
+        return HumanPlayer("test_player")
+
+    def test_deferred_state_visible_before_flush(self, stored_states, player):
+        """Test a deferred value is returned by get_state but not written until flush_state."""
+        player.defer_state("talked_to_players", ["a@example.com"])
+        assert player.get_state("talked_to_players", []) == ["a@example.com"], "deferred value should be visible right away"
+        assert "talked_to_players" not in stored_states.get("test_player", {}), "deferred value should not be written yet"
+
+    def test_flush_writes_deferred_state(self, stored_states, player):
+        """Test flush_state writes every deferred value in one update and clears the pending state."""
+        player.defer_state("talked_to_players", ["a@example.com"])
+        player.defer_state("visits", 2)
+        player.flush_state()
+        assert stored_states["test_player"] == {"talked_to_players": ["a@example.com"], "visits": 2}
+        assert player._pending_state == {}, "pending state should be empty after a flush"
+        assert player.get_state("visits") == 2, "flushed value should be read back from the database"
+
+    def test_set_state_overrides_pending_key(self, stored_states, player):
+        """Test set_state replaces a deferred value, and a later flush does not bring the old value back."""
+        player.defer_state("visits", 1)
+        player.set_state("visits", 5)
+        assert player.get_state("visits") == 5, "set_state should win over the deferred value"
+        player.flush_state()
+        assert stored_states["test_player"]["visits"] == 5, "flush should not overwrite the value from set_state"
+
+    def test_flush_rejects_unserializable_state(self, stored_states, player):
+        """Test flush_state refuses values that cannot be stored and keeps them pending."""
+        player.defer_state("bad", object())
+        with pytest.raises(ValueError):
+            player.flush_state()
+        assert "test_player" not in stored_states, "nothing should be written when a value is invalid"
+        assert "bad" in player._pending_state, "the invalid value should stay pending"
@@ -456,6 +456,32 @@ class TestDumbledoresOffice:
         messages = dumbledores_office.move(player, "up")
         assert observer_message in messages, "Messages from position observers should be included in return value"
 
+    def test_move_n_walks_through_room_move(self, dumbledores_office, player, monkeypatch):
+        """Test move_n steps through the office's move and stops at a blocked cell mid-path."""
+        blocked = Coord(2, 5)
+        visited = []
+
+        def mock_move(self, player, direction):
+            new_position = player.get_current_position() + Coord(-1, 0)  # only walks up
+            if new_position == blocked:
+                return []
+            player._current_position = new_position
+            visited.append(new_position)
+            return [ServerMessage(player, f"moved to {new_position}")]
+
+        monkeypatch.setattr(Map, "move", mock_move)
+        dumbledores_office.move_n(player, "up", 5)
+        assert visited == [Coord(4, 5), Coord(3, 5)], "each step should go through move, one tile at a time"
+        assert player.get_current_position() == Coord(3, 5), "the walk should stop before the blocked cell"
+
+    def test_move_n_respects_door_gate(self, dumbledores_office, player, mock_super_move):
+        """Test move_n cannot walk a player off the door, just like move."""
+        player._current_position = Coord(13, 7)  # door position
+        messages = dumbledores_office.move_n(player, "right", 3)
+        assert not mock_super_move["value"], "the door gate should stop the walk before super().move"
+        assert any(isinstance(message, ServerMessage) for message in messages), "should return the door message"
+        assert player.get_current_position() == Coord(13, 7), "player should stay on the door"
+
     # OTHER FUNCTIONALITIES TEST
     
     def test_get_name(self, dumbledores_office):